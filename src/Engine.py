@@ -23,6 +23,26 @@ def get_atmospheric_pressure(altitude):
     return max(pressure, 0.0)
 
 
+# Pressure is smooth in altitude, so hot loops interpolate a table built once at import
+_ALT_STEP = 200.0
+_ALT_GRID = np.arange(0.0, 200000.0 + _ALT_STEP, _ALT_STEP)
+_P_GRID = np.array([get_atmospheric_pressure(h) for h in _ALT_GRID])
+_P_TABLE = _P_GRID.tolist()
+
+
+def fast_atmospheric_pressure(altitude):
+    if isinstance(altitude, np.ndarray):
+        return np.interp(altitude, _ALT_GRID, _P_GRID)
+
+    pos = altitude / _ALT_STEP
+    if pos <= 0.0:
+        return _P_TABLE[0]
+    i = int(pos)
+    if i >= len(_P_TABLE) - 1:
+        return _P_TABLE[-1]
+    return _P_TABLE[i] + (_P_TABLE[i + 1] - _P_TABLE[i]) * (pos - i)
+
+
 def calculate_drag(velocity, altitude, reference_area=1.0):
 
     p0 = 1.225
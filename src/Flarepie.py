@@ -1,39 +1,338 @@
 import tkinter as tk
-from tkinter import messagebox, scrolledtext, ttk, filedialog, simpledialog
+from tkinter import messagebox, scrolledtext, ttk, filedialog, font as tkfont
 import matplotlib
 matplotlib.use('TkAgg')
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-from matplotlib.animation import FuncAnimation
+from matplotlib.image import imread
+from matplotlib.animation import FuncAnimation, ArtistAnimation, PillowWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 import csv
+import functools
 from datetime import datetime
-import time
 import os
-from Engine import rocket_simulation, nozzle_performance, get_atmospheric_pressure
+from concurrent.futures import ThreadPoolExecutor
+from Engine import nozzle_performance, get_atmospheric_pressure, calculate_drag
 from config import config
-from project_manager import ProjectManager, SimulationConfig
+from project_manager import ProjectManager
 from advanced_engine import AdvancedRocketEngine, Stage, OrbitalMechanics, ThermalAnalysis
 from report_generator import ReportGenerator
-from mpl_toolkits.mplot3d import Axes3D  # For 3D plotting
 import math
-import urllib.request
+import re
 import sys
 
+EARTH_TEXTURE_URL = "https://eoimages.gsfc.nasa.gov/images/imagerecords/57000/57730/land_ocean_ice_2048.png"
+EARTH_TEXTURE_PATH = "earth_texture.png"
+
+# Matches every prefix of a float literal, so "-", "1." or "7e" can still be typed on the way
+_NUMERIC_INPUT = re.compile(r"[-+]?\d*\.?\d*(?:[eE][-+]?\d*)?")
+
+# A complete float literal; inputs are checked against it instead of letting float() raise
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+FUEL_TYPES = ("RP1", "LH2", "SRF", "N2O4")
+
+# Numeric rocket inputs in the order run_rocket_simulation unpacks them
+_ROCKET_NUMERIC_KEYS = ("cocp", "ct", "altitude", "intmass", "propmass", "dt", "reference_area")
+
+# Input panel rows: (label, key, default, tooltip) for the StringVar grids and
+# (label, attribute, default) for the rows stored directly on the app
+ROCKET_FIELDS = (
+    ("Fuel Type:", "fuel_type", "RP1", "Type of propellant used (RP1, LH2, SRF, N2O4)"),
+    ("Chamber Pressure (Pa):", "cocp", "7000000", "Pressure in combustion chamber"),
+    ("Combustion Temp (K):", "ct", "3500", "Combustion temperature in Kelvin"),
+    ("Initial Altitude (m):", "altitude", "0", "Launch altitude above sea level"),
+    ("Total Mass (kg):", "intmass", "10000", "Total mass at launch"),
+    ("Propellant Mass (kg):", "propmass", "8000", "Mass of propellant"),
+    ("Mass Flow Rate (kg/s):", "mfr", "250", "Propellant mass flow rate"),
+    ("Time Step (s):", "dt", "0.1", "Simulation time step"),
+    ("Reference Area (m²):", "reference_area", "1.0", "Reference area for drag calculation")
+)
+
+NOZZLE_FIELDS = (
+    ("Mass Flow (kg/s):", "mfr", "250", "Nozzle mass flow rate"),
+    ("Exhaust Velocity (m/s):", "ve", "3000", "Exhaust velocity at nozzle exit"),
+    ("Exit Pressure (Pa):", "expa", "101325", "Pressure at nozzle exit"),
+    ("Ambient Pressure (Pa):", "amp", "101325", "Ambient pressure"),
+    ("Exit Area (m²):", "ea", "1.0", "Nozzle exit area")
+)
+
+FAILURE_FIELDS = (
+    ("Failure Time (s):", "failure_time_var", "10.0"),
+    ("Abort Time (s):", "abort_time_var", "15.0"),
+    ("Parachute Area (m²):", "parachute_area_var", "10.0"),
+    ("Parachute Drag Coeff.: ", "parachute_cd_var", "1.5")
+)
+
+WIND_FIELDS = (
+    ("Wind Speed at Ground (m/s):", "wind_ground_var", "0.0"),
+    ("Wind Speed at Altitude (m/s):", "wind_alt_var", "0.0"),
+    ("Wind Direction (deg from N):", "wind_dir_var", "0.0")
+)
+
+STABILITY_FIELDS = (
+    ("Body Length (m):", "body_length_var", "5.0"),
+    ("Body Diameter (m):", "body_diam_var", "0.4"),
+    ("Nose Length (m):", "nose_length_var", "1.0"),
+    ("Fin Root Chord (m):", "fin_root_var", "0.5"),
+    ("Fin Tip Chord (m):", "fin_tip_var", "0.2"),
+    ("Fin Span (m):", "fin_span_var", "0.3"),
+    ("Number of Fins:", "fin_num_var", "4")
+)
+
+# Nozzle designer parameter rows: (label, design key, default)
+NOZZLE_DESIGN_FIELDS = (
+    ("Chamber Radius (m):", "chamber_r", "0.25"),
+    ("Throat Radius (m):", "throat_r", "0.1"),
+    ("Exit Radius (m):", "exit_r", "0.3"),
+    ("Nozzle Length (m):", "length", "1.0"),
+    ("Nozzle Angle (deg):", "angle", "15.0"),
+    ("Wall Thickness (m):", "wall", "0.01")
+)
+
+_EARTH_TEXTURE_CACHE = {}
+_EARTH_SPHERE_CACHE = {}
+
+
+def parse_floats(texts):
+    """Parse each string as a float; returns None if any of them is not a number."""
+    values = []
+    for text in texts:
+        text = text.strip()
+        if _NUMBER.fullmatch(text) is None:
+            return None
+        values.append(float(text))
+    return values
+
+
+def get_earth_texture(texture_path=EARTH_TEXTURE_PATH):
+    """Return the decoded Earth texture as float32 RGB(A), downloading and decoding it once."""
+    if not os.path.exists(texture_path):
+        import urllib.request
+        # Download beside the target and rename, so an interrupted transfer is never reused
+        tmp_path = texture_path + ".part"
+        urllib.request.urlretrieve(EARTH_TEXTURE_URL, tmp_path)
+        os.replace(tmp_path, texture_path)
+
+    key = (texture_path, os.path.getmtime(texture_path))
+    img = _EARTH_TEXTURE_CACHE.get(key)
+    if img is None:
+        img = imread(texture_path)
+        img = (img / 255.0 if img.dtype.kind in 'ui' else img).astype(np.float32, copy=False)
+        _EARTH_TEXTURE_CACHE.clear()
+        _EARTH_TEXTURE_CACHE[key] = img
+    return key, img
+
+
+def get_earth_sphere(radius, n=80, texture_path=EARTH_TEXTURE_PATH):
+    """Return (verts, facecolors) for a textured sphere, built once per texture."""
+    texture_key, img = get_earth_texture(texture_path)
+    key = (texture_key, radius, n)
+    cached = _EARTH_SPHERE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    u = np.linspace(0, 2 * np.pi, n)
+    v = np.linspace(0, np.pi, n // 2)
+    lon_img = (u / (2 * np.pi) * img.shape[1]).astype(np.int32) % img.shape[1]
+    lat_img = (v / np.pi * img.shape[0]).astype(np.int32) % img.shape[0]
+    colors = img[lat_img[:-1, None], lon_img[None, :-1]]
+
+    u = u[None, :]
+    v = v[:, None]
+    points = np.empty((len(v), u.shape[1], 3), dtype=np.float32)
+    points[..., 0] = radius * np.cos(u) * np.sin(v)
+    points[..., 1] = radius * np.sin(u) * np.sin(v)
+    points[..., 2] = radius * np.cos(v)
+    verts = np.stack(
+        [points[:-1, :-1], points[:-1, 1:], points[1:, 1:], points[1:, :-1]], axis=2
+    ).reshape(-1, 4, 3)
+    facecolors = colors.reshape(-1, colors.shape[-1])
+
+    _EARTH_SPHERE_CACHE.clear()
+    _EARTH_SPHERE_CACHE[key] = (verts, facecolors)
+    return verts, facecolors
+
+
+@functools.lru_cache(maxsize=1)
+def get_icon_path():
+    if getattr(sys, 'frozen', False):
+        meipass = getattr(sys, '_MEIPASS', None)
+        if meipass is not None:
+            return os.path.join(meipass, 'logo.ico')
+    return 'logo.ico'
+
+
+def trajectory_frame_ends(n_samples, max_frames=100):
+    """End index of each animation frame: about one frame per three samples, 10 to max_frames."""
+    n_frames = max(10, min(max_frames, n_samples // 3))
+    return np.linspace(1, n_samples, n_frames, dtype=int)
+
+
+def trajectory_frame_indices(n_samples, max_frames=100, max_points=500):
+    """Sample indices drawn by each frame: a shared decimation that keeps every frame's end sample."""
+    frame_ends = trajectory_frame_ends(n_samples, max_frames)
+    step = max(1, -(-n_samples // max_points))
+    keep = np.union1d(np.arange(0, n_samples, step), frame_ends - 1)
+    # Slices of one sorted index array, so no frame holds more than about max_points points
+    return [keep[:np.searchsorted(keep, end)] for end in frame_ends]
+
+
+def build_trajectory_frames(fig, simulation_data):
+    """Set up the (time, velocity, altitude) 3D axes on fig and return one artist list per frame."""
+    ax = fig.add_subplot(111, projection='3d')
+    time_data = np.asarray(simulation_data['time'], dtype=float)
+    altitude_data = np.asarray(simulation_data['altitude'], dtype=float)
+    velocity_data = np.asarray(simulation_data['velocity'], dtype=float)
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Velocity (m/s)')
+    ax.set_zlabel('Altitude (m)')  # type: ignore[attr-defined]
+    ax.set_title('3D Trajectory (Time, Velocity, Altitude)')
+    ax.grid(True)
+    ax.set_xlim(float(min(time_data)), float(max(time_data)))
+    ax.set_ylim(float(min(velocity_data)), float(max(velocity_data)))
+    ax.set_zlim(float(min(altitude_data)), float(max(altitude_data)))  # type: ignore[attr-defined]
+    # The whole trajectory is known up front, so build every frame's artist once
+    # and let ArtistAnimation swap them without a Python callback per frame.
+    return [
+        ax.plot(time_data[idx], velocity_data[idx], altitude_data[idx],
+                color='cyan', linewidth=2, animated=True)
+        for idx in trajectory_frame_indices(len(time_data))
+    ]
+
+
+def export_trajectory_animation(simulation_data, path, fps=20):
+    """Render the 3D trajectory animation to a GIF off-screen, without touching the Tk canvas."""
+    fig = Figure(figsize=(8, 6))
+    FigureCanvasAgg(fig)
+    frames = build_trajectory_frames(fig, simulation_data)
+    animation = ArtistAnimation(fig, frames, interval=1000 / fps, blit=False, repeat=False)
+    animation.save(path, writer=PillowWriter(fps=fps))
+    return path
+
+
+def simulate_trajectory(fuel_type, cocp, ct, altitude, intmass, propmass, mfr, dt, reference_area,
+                        failure_time=None, abort_time=None, parachute_area=0.0, parachute_cd=0.0):
+    """Integrate the flight with the midpoint method; pure computation, safe to run off the Tk thread."""
+    k, R = {"RP1": (1.2, 287.0), "LH2": (1.4, 4124.0), "SRF": (1.2, 191.0), "N2O4": (1.26, 320.0)}[fuel_type]
+    current_mass = intmass
+    time_elapsed = 0.0
+    velocity = 0.0
+    current_altitude = altitude
+    delta_v = 0.0
+    energy_values = []
+    drag_values = []
+    acceleration_values = []
+    time_steps = []
+    thrust_values = []
+    fuel_remaining = []
+    mass_flow_values = []
+    velocity_values = []
+    altitude_values = []
+    isp_values = []
+    failure_event_idx = None
+    abort_event_idx = None
+    abort_triggered = False
+    max_time = 10000.0
+    max_iterations = 200000
+    iterations = 0
+    while (propmass > 0 or (abort_triggered and current_altitude > 0.5 and abs(velocity) > 0.5)) and time_elapsed < max_time and iterations < max_iterations:
+        ap = get_atmospheric_pressure(current_altitude)
+        pressure_ratio = (ap / cocp) ** ((k - 1) / k) if cocp > 0 else 0.0
+        ve = (2.0 * k) / (k - 1.0) * R * ct * (1.0 - pressure_ratio)
+        ve = max(0.0, ve) ** 0.5
+        thrust = mfr * ve
+        if failure_time is not None and time_elapsed >= failure_time:
+            if failure_event_idx is None:
+                failure_event_idx = len(time_steps)
+            thrust = 0.0
+            mfr = 0.0
+        if abort_time is not None and time_elapsed >= abort_time:
+            if abort_event_idx is None:
+                abort_event_idx = len(time_steps)
+                abort_triggered = True
+            thrust = 0.0
+            mfr = 0.0
+        mass_used = min(mfr * dt, propmass)
+        propmass -= mass_used
+        current_mass -= mass_used
+        if abort_triggered:
+            p0 = 1.225
+            h0 = 8500
+            density = p0 * math.exp(-current_altitude / h0)
+            drag = 0.5 * density * velocity ** 2 * parachute_area * parachute_cd * (-1 if velocity > 0 else 1)
+        else:
+            drag = calculate_drag(velocity, current_altitude, reference_area)
+        acceleration = (thrust / current_mass) - 9.81 - (drag / current_mass)
+        velocity_mid = velocity + 0.5 * acceleration * dt
+        altitude_mid = current_altitude + 0.5 * velocity * dt
+        if abort_triggered:
+            density_mid = p0 * math.exp(-altitude_mid / h0)
+            drag_mid = 0.5 * density_mid * velocity_mid ** 2 * parachute_area * parachute_cd * (-1 if velocity_mid > 0 else 1)
+        else:
+            drag_mid = calculate_drag(velocity_mid, altitude_mid, reference_area)
+        acceleration_mid = (thrust / current_mass) - 9.81 - (drag_mid / current_mass)
+        velocity_new = velocity + acceleration_mid * dt
+        altitude_new = current_altitude + velocity_mid * dt
+        delta_v_step = max(0.0, velocity_new - velocity)
+        delta_v += delta_v_step
+        kinetic_energy = 0.5 * current_mass * velocity ** 2
+        potential_energy = current_mass * 9.81 * current_altitude
+        energy_values.append(kinetic_energy + potential_energy)
+        isp = thrust / (mfr * 9.81) if mfr > 0 else 0.0
+        time_steps.append(time_elapsed)
+        thrust_values.append(thrust)
+        fuel_remaining.append(propmass)
+        mass_flow_values.append(mfr)
+        velocity_values.append(velocity)
+        altitude_values.append(current_altitude)
+        isp_values.append(isp)
+        drag_values.append(drag)
+        acceleration_values.append(acceleration)
+        velocity = velocity_new
+        current_altitude = altitude_new
+        time_elapsed += dt
+        iterations += 1
+        # Ensure after abort, rocket lands
+        if abort_triggered and current_altitude <= 0:
+            break
+        if thrust == 0.0 and propmass <= 0 and not abort_triggered:
+            break
+    results = {
+        "time": time_steps,
+        "thrust": thrust_values,
+        "fuel_remaining": fuel_remaining,
+        "mass_flow": mass_flow_values,
+        "velocity": velocity_values,
+        "altitude": altitude_values,
+        "isp_values": isp_values,
+        "energy": energy_values,
+        "drag": drag_values,
+        "acceleration": acceleration_values,
+        "final_time": time_elapsed,
+        "initial_thrust": thrust_values[0] if thrust_values else 0,
+        "delta_v": delta_v,
+        "simulation_complete": True,
+        "failure_event_idx": failure_event_idx,
+        "abort_event_idx": abort_event_idx
+    }
+    return results
+
 
 class FlarePieApp:
+
+    # How often the Tk loop checks a background simulation for its result
+    SIM_POLL_MS = 50
+
     def __init__(self, root):
         self.root = root
         self.root.title("FlarePie 6.0 - Professional Rocket Simulation")
         self.root.geometry("1400x800")
         self.root.configure(bg=config.get("theme.primary_color", "#0D1B2A"))
         try:
-            import sys, os
-            if getattr(sys, 'frozen', False):
-                icon_path = os.path.join(sys._MEIPASS, 'logo.ico')
-            else:
-                icon_path = 'logo.ico'
-            self.root.iconbitmap(icon_path)
+            # default= makes every Toplevel inherit the icon, so it is loaded once per session
+            self.root.iconbitmap(default=get_icon_path())
         except Exception as e:
             print("Icon not set:", e)
 
@@ -41,6 +340,8 @@ class FlarePieApp:
         self.advanced_engine = AdvancedRocketEngine()
         self.report_generator = ReportGenerator()
         self.thermal_analysis = ThermalAnalysis()
+        self._sim_executor = ThreadPoolExecutor(max_workers=1)
+        self._sim_future = None
         
         self.animation = None
         self.simulation_data = None
@@ -49,6 +350,7 @@ class FlarePieApp:
         self.undo_stack = []
         self.redo_stack = []
         self._tooltip = None
+        self._tooltip_texts = {}
 
         self.create_custom_style()
         self.create_menu_bar()
@@ -58,6 +360,16 @@ class FlarePieApp:
         self.create_toolbar()
         
         self.load_default_config()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        """Stop background work and destroy the window tree in one call."""
+        self.stop_animation()
+        # A queued run is dropped; a running one finishes on its own without
+        # a poll left to deliver its result
+        self._sim_executor.shutdown(wait=False, cancel_futures=True)
+        self._sim_future = None
+        self.root.destroy()
 
     def create_menu_bar(self):
         menubar = tk.Menu(self.root)
@@ -66,8 +378,9 @@ class FlarePieApp:
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Export Report", command=self.export_report)
+        file_menu.add_command(label="Export 3D Animation", command=self.export_animation)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.on_close)
         
         edit_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Edit", menu=edit_menu)
@@ -129,21 +442,19 @@ class FlarePieApp:
         header_frame = tk.Frame(self.root, bg="#1B263B")
         header_frame.pack(fill=tk.X, pady=2)
 
-        self.timestamp_label = tk.Label(
+        self.timestamp_label = ttk.Label(
             header_frame,
             text="Current Date and Time (UTC - YYYY-MM-DD HH:MM:SS formatted): " + datetime.now().strftime(
                 '%Y-%m-%d %H:%M:%S'),
-            fg="#E0E1DD", bg="#1B263B",
-            font=("Helvetica", 8)
+            style="Header.TLabel"
         )
         self.timestamp_label.pack(side=tk.LEFT, padx=10)
 
         user_name = os.environ.get('USER', os.environ.get('USERNAME', 'Elexs1zz'))
-        user_label = tk.Label(
+        user_label = ttk.Label(
             header_frame,
             text="Current User's Login: " + user_name,
-            fg="#E0E1DD", bg="#1B263B",
-            font=("Helvetica", 8)
+            style="Header.TLabel"
         )
         user_label.pack(side=tk.RIGHT, padx=10)
 
@@ -158,18 +469,22 @@ class FlarePieApp:
         style = ttk.Style()
         style.theme_use('clam')
 
+        # Named fonts are resolved by Tk once and shared by every style and widget that uses them
+        self.body_font = tkfont.Font(root=self.root, family="Helvetica", size=10)
+        self.bold_font = tkfont.Font(root=self.root, family="Helvetica", size=10, weight="bold")
+
         style.configure("TFrame", background="#0D1B2A")
 
         style.configure(
             "TLabel",
-            font=("Helvetica", 10),
+            font=self.body_font,
             foreground="#E0E1DD",
             background="#0D1B2A"
         )
 
         style.configure(
             "TButton",
-            font=("Helvetica", 10, "bold"),
+            font=self.bold_font,
             foreground="#E0E1DD",
             background="#1B263B",
             padding=6
@@ -183,12 +498,19 @@ class FlarePieApp:
         )
         style.configure(
             "TNotebook.Tab",
-            font=("Helvetica", 10),
+            font=self.body_font,
             foreground="#E0E1DD",
             padding=[10, 2]
         )
         style.map("TNotebook.Tab", background=[("selected", "#415A77"), ("active", "#778DA9")])
 
+        # Header and live-metric labels share these instead of carrying their own colors and fonts
+        style.configure("Header.TLabel", font=("Helvetica", 8), foreground="#E0E1DD", background="#1B263B")
+        style.configure("MetricName.TLabel", font=self.bold_font, foreground="white", background="#1B263B")
+        style.configure("MetricValue.TLabel", font=self.body_font, foreground="cyan", background="#1B263B")
+        style.configure("Status.TLabel", foreground="#E0E1DD", background="#1B263B",
+                        borderwidth=1, relief=tk.SUNKEN, anchor=tk.W)
+
     def create_main_layout(self):
         main_frame = ttk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -198,7 +520,9 @@ class FlarePieApp:
         self.create_output_panel(main_frame)
 
     def create_input_panel(self, parent):
-        from tkinter import font
+        # Numeric entries reject non-numeric keystrokes instead of failing at simulate time
+        self._numeric_vcmd = (self.root.register(self._is_numeric_input), '%P')
+
         input_frame = ttk.Frame(parent, width=360)
         input_frame.pack(side=tk.LEFT, fill=tk.Y, padx=8, pady=8)
         input_frame.pack_propagate(False)
@@ -230,47 +554,11 @@ class FlarePieApp:
 
         rocket_tab = ttk.Frame(notebook)
         notebook.add(rocket_tab, text="Rocket")
-        rocket_fields = [
-            ("Fuel Type:", "fuel_type", "RP1", "Type of propellant used (RP1, LH2, SRF, N2O4)"),
-            ("Chamber Pressure (Pa):", "cocp", "7000000", "Pressure in combustion chamber"),
-            ("Combustion Temp (K):", "ct", "3500", "Combustion temperature in Kelvin"),
-            ("Initial Altitude (m):", "altitude", "0", "Launch altitude above sea level"),
-            ("Total Mass (kg):", "intmass", "10000", "Total mass at launch"),
-            ("Propellant Mass (kg):", "propmass", "8000", "Mass of propellant"),
-            ("Mass Flow Rate (kg/s):", "mfr", "250", "Propellant mass flow rate"),
-            ("Time Step (s):", "dt", "0.1", "Simulation time step"),
-            ("Reference Area (m²):", "reference_area", "1.0", "Reference area for drag calculation")
-        ]
-        self.rocket_vars = {}
-        for i, (label_text, var_name, default, tooltip) in enumerate(rocket_fields):
-            lbl = ttk.Label(rocket_tab, text=label_text)
-            lbl.grid(row=i, column=0, sticky='w', padx=6, pady=3)
-            var = tk.StringVar(value=default)
-            entry = ttk.Entry(rocket_tab, textvariable=var, width=16)
-            entry.grid(row=i, column=1, padx=6, pady=3)
-            self.rocket_vars[var_name] = var
-            self._add_tooltip(lbl, tooltip)
-            self._add_tooltip(entry, tooltip)
+        self.rocket_vars = self._build_field_grid(rocket_tab, ROCKET_FIELDS, choices={"fuel_type": FUEL_TYPES})
 
         nozzle_tab = ttk.Frame(notebook)
         notebook.add(nozzle_tab, text="Nozzle/Engine")
-        nozzle_fields = [
-            ("Mass Flow (kg/s):", "mfr", "250", "Nozzle mass flow rate"),
-            ("Exhaust Velocity (m/s):", "ve", "3000", "Exhaust velocity at nozzle exit"),
-            ("Exit Pressure (Pa):", "expa", "101325", "Pressure at nozzle exit"),
-            ("Ambient Pressure (Pa):", "amp", "101325", "Ambient pressure"),
-            ("Exit Area (m²):", "ea", "1.0", "Nozzle exit area")
-        ]
-        self.nozzle_vars = {}
-        for i, (label_text, var_name, default, tooltip) in enumerate(nozzle_fields):
-            lbl = ttk.Label(nozzle_tab, text=label_text)
-            lbl.grid(row=i, column=0, sticky='w', padx=6, pady=3)
-            var = tk.StringVar(value=default)
-            entry = ttk.Entry(nozzle_tab, textvariable=var, width=16)
-            entry.grid(row=i, column=1, padx=6, pady=3)
-            self.nozzle_vars[var_name] = var
-            self._add_tooltip(lbl, tooltip)
-            self._add_tooltip(entry, tooltip)
+        self.nozzle_vars = self._build_field_grid(nozzle_tab, NOZZLE_FIELDS)
 
         failure_tab = ttk.Frame(notebook)
         notebook.add(failure_tab, text="Failure/Abort")
@@ -278,18 +566,7 @@ class FlarePieApp:
         self.enable_abort_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(failure_tab, text="Enable Engine Failure", variable=self.enable_failure_var).grid(row=0, column=0, sticky='w', padx=6, pady=3)
         ttk.Checkbutton(failure_tab, text="Enable Abort Sequence", variable=self.enable_abort_var).grid(row=1, column=0, sticky='w', padx=6, pady=3)
-        ttk.Label(failure_tab, text="Failure Time (s):").grid(row=2, column=0, sticky='w', padx=6, pady=3)
-        self.failure_time_var = tk.StringVar(value="10.0")
-        ttk.Entry(failure_tab, textvariable=self.failure_time_var, width=12).grid(row=2, column=1, padx=6, pady=3)
-        ttk.Label(failure_tab, text="Abort Time (s):").grid(row=3, column=0, sticky='w', padx=6, pady=3)
-        self.abort_time_var = tk.StringVar(value="15.0")
-        ttk.Entry(failure_tab, textvariable=self.abort_time_var, width=12).grid(row=3, column=1, padx=6, pady=3)
-        ttk.Label(failure_tab, text="Parachute Area (m²):").grid(row=4, column=0, sticky='w', padx=6, pady=3)
-        self.parachute_area_var = tk.StringVar(value="10.0")
-        ttk.Entry(failure_tab, textvariable=self.parachute_area_var, width=12).grid(row=4, column=1, padx=6, pady=3)
-        ttk.Label(failure_tab, text="Parachute Drag Coeff.: ").grid(row=5, column=0, sticky='w', padx=6, pady=3)
-        self.parachute_cd_var = tk.StringVar(value="1.5")
-        ttk.Entry(failure_tab, textvariable=self.parachute_cd_var, width=12).grid(row=5, column=1, padx=6, pady=3)
+        self._build_entry_rows(failure_tab, FAILURE_FIELDS, start_row=2, width=12)
         self._add_tooltip(failure_tab, "Configure failure and abort scenarios for the simulation.")
 
         options_tab = ttk.Frame(notebook)
@@ -308,15 +585,7 @@ class FlarePieApp:
             variable=self.animate_var
         )
         animate_check.grid(row=1, column=0, sticky='w', padx=6, pady=3)
-        ttk.Label(options_tab, text="Wind Speed at Ground (m/s):").grid(row=7, column=0, sticky='w', padx=6, pady=3)
-        self.wind_ground_var = tk.StringVar(value="0.0")
-        ttk.Entry(options_tab, textvariable=self.wind_ground_var, width=10).grid(row=7, column=1, padx=6, pady=3)
-        ttk.Label(options_tab, text="Wind Speed at Altitude (m/s):").grid(row=8, column=0, sticky='w', padx=6, pady=3)
-        self.wind_alt_var = tk.StringVar(value="0.0")
-        ttk.Entry(options_tab, textvariable=self.wind_alt_var, width=10).grid(row=8, column=1, padx=6, pady=3)
-        ttk.Label(options_tab, text="Wind Direction (deg from N):").grid(row=9, column=0, sticky='w', padx=6, pady=3)
-        self.wind_dir_var = tk.StringVar(value="0.0")
-        ttk.Entry(options_tab, textvariable=self.wind_dir_var, width=10).grid(row=9, column=1, padx=6, pady=3)
+        self._build_entry_rows(options_tab, WIND_FIELDS, start_row=7)
         ttk.Button(options_tab, text="Open Engine/Nozzle Designer", command=self.open_nozzle_designer).grid(row=2, column=0, columnspan=2, sticky='ew', padx=6, pady=8)
         ttk.Button(options_tab, text="Reset to Defaults", command=self.load_default_config).grid(row=3, column=0, columnspan=2, sticky='ew', padx=6, pady=8)
         ttk.Button(options_tab, text="Run Rocket Simulation", command=self.run_rocket_simulation, style="Accent.TButton").grid(row=4, column=0, columnspan=2, sticky='ew', padx=6, pady=8)
@@ -324,37 +593,16 @@ class FlarePieApp:
         ttk.Button(options_tab, text="Stop Animation", command=self.stop_animation).grid(row=6, column=0, columnspan=2, sticky='ew', padx=6, pady=2)
         stability_tab = ttk.Frame(notebook)
         notebook.add(stability_tab, text="Stability Analysis")
-        ttk.Label(stability_tab, text="Body Length (m):").grid(row=0, column=0, sticky='w', padx=6, pady=3)
-        self.body_length_var = tk.StringVar(value="5.0")
-        ttk.Entry(stability_tab, textvariable=self.body_length_var, width=10).grid(row=0, column=1, padx=6, pady=3)
-        ttk.Label(stability_tab, text="Body Diameter (m):").grid(row=1, column=0, sticky='w', padx=6, pady=3)
-        self.body_diam_var = tk.StringVar(value="0.4")
-        ttk.Entry(stability_tab, textvariable=self.body_diam_var, width=10).grid(row=1, column=1, padx=6, pady=3)
-        ttk.Label(stability_tab, text="Nose Length (m):").grid(row=2, column=0, sticky='w', padx=6, pady=3)
-        self.nose_length_var = tk.StringVar(value="1.0")
-        ttk.Entry(stability_tab, textvariable=self.nose_length_var, width=10).grid(row=2, column=1, padx=6, pady=3)
-        ttk.Label(stability_tab, text="Fin Root Chord (m):").grid(row=3, column=0, sticky='w', padx=6, pady=3)
-        self.fin_root_var = tk.StringVar(value="0.5")
-        ttk.Entry(stability_tab, textvariable=self.fin_root_var, width=10).grid(row=3, column=1, padx=6, pady=3)
-        ttk.Label(stability_tab, text="Fin Tip Chord (m):").grid(row=4, column=0, sticky='w', padx=6, pady=3)
-        self.fin_tip_var = tk.StringVar(value="0.2")
-        ttk.Entry(stability_tab, textvariable=self.fin_tip_var, width=10).grid(row=4, column=1, padx=6, pady=3)
-        ttk.Label(stability_tab, text="Fin Span (m):").grid(row=5, column=0, sticky='w', padx=6, pady=3)
-        self.fin_span_var = tk.StringVar(value="0.3")
-        ttk.Entry(stability_tab, textvariable=self.fin_span_var, width=10).grid(row=5, column=1, padx=6, pady=3)
-        ttk.Label(stability_tab, text="Number of Fins:").grid(row=6, column=0, sticky='w', padx=6, pady=3)
-        self.fin_num_var = tk.StringVar(value="4")
-        ttk.Entry(stability_tab, textvariable=self.fin_num_var, width=10).grid(row=6, column=1, padx=6, pady=3)
+        self._build_entry_rows(stability_tab, STABILITY_FIELDS)
         ttk.Button(stability_tab, text="Calculate CG/CP", command=self.calculate_cg_cp).grid(row=7, column=0, columnspan=2, pady=8)
         self.cgcp_result_var = tk.StringVar(value="")
-        ttk.Label(stability_tab, textvariable=self.cgcp_result_var, font=("Helvetica", 10, "bold")).grid(row=8, column=0, columnspan=2, pady=4)
+        ttk.Label(stability_tab, textvariable=self.cgcp_result_var, font=self.bold_font).grid(row=8, column=0, columnspan=2, pady=4)
         self.cgcp_canvas = None
         def draw_schematic():
-            import matplotlib.pyplot as plt
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
             if self.cgcp_canvas:
                 self.cgcp_canvas.get_tk_widget().destroy()
-            fig, ax = plt.subplots(figsize=(3, 1.2))
+            fig = Figure(figsize=(3, 1.2))
+            ax = fig.subplots()
             L = float(self.body_length_var.get())
             D = float(self.body_diam_var.get())
             cg = getattr(self, 'last_cg', L/2)
@@ -374,21 +622,65 @@ class FlarePieApp:
             self.cgcp_canvas.get_tk_widget().grid(row=9, column=0, columnspan=2, pady=4)
         self.draw_cgcp_schematic = draw_schematic
 
+    def _is_numeric_input(self, proposed):
+        return _NUMERIC_INPUT.fullmatch(proposed) is not None
+
+    def _build_field_grid(self, parent, fields, choices=None):
+        # fields are (label, key, default, tooltip) rows; keys in choices get a fixed pick-list.
+        # Returns the StringVars by key
+        choices = choices or {}
+        variables = {}
+        for i, (label_text, var_name, default, tooltip) in enumerate(fields):
+            lbl = ttk.Label(parent, text=label_text)
+            lbl.grid(row=i, column=0, sticky='w', padx=6, pady=3)
+            var = tk.StringVar(value=default)
+            if var_name in choices:
+                entry = ttk.Combobox(parent, textvariable=var, values=choices[var_name], state="readonly", width=14)
+            else:
+                entry = ttk.Entry(parent, textvariable=var, width=16,
+                                  validate="key", validatecommand=self._numeric_vcmd)
+            entry.grid(row=i, column=1, padx=6, pady=3)
+            variables[var_name] = var
+            self._add_tooltip(lbl, tooltip)
+            self._add_tooltip(entry, tooltip)
+        return variables
+
+    def _build_entry_rows(self, parent, fields, start_row=0, width=10):
+        # fields are (label, attribute, default) rows; each StringVar is stored on self
+        for row, (label_text, attr, default) in enumerate(fields, start=start_row):
+            ttk.Label(parent, text=label_text).grid(row=row, column=0, sticky='w', padx=6, pady=3)
+            var = tk.StringVar(value=default)
+            ttk.Entry(parent, textvariable=var, width=width,
+                      validate="key", validatecommand=self._numeric_vcmd).grid(row=row, column=1, padx=6, pady=3)
+            setattr(self, attr, var)
+
     def _add_tooltip(self, widget, text):
-        def on_enter(event):
-            self._tooltip = tk.Toplevel(widget)
-            self._tooltip.wm_overrideredirect(True)
-            x = widget.winfo_rootx() + 20
-            y = widget.winfo_rooty() + 20
-            self._tooltip.wm_geometry(f"+{x}+{y}")
-            label = tk.Label(self._tooltip, text=text, background="#333", foreground="#fff", relief="solid", borderwidth=1, font=("Helvetica", 9))
-            label.pack(ipadx=4, ipady=2)
-        def on_leave(event):
-            if hasattr(self, '_tooltip') and self._tooltip:
-                self._tooltip.destroy()
-                self._tooltip = None
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        # One pair of class bindings serves every tooltip; widgets only join the tag,
+        # so no per-widget closures or Tcl commands are created
+        if not self._tooltip_texts:
+            self.root.bind_class("Tooltip", "<Enter>", self._show_tooltip)
+            self.root.bind_class("Tooltip", "<Leave>", self._hide_tooltip)
+        self._tooltip_texts[str(widget)] = text
+        widget.bindtags(widget.bindtags() + ("Tooltip",))
+
+    def _show_tooltip(self, event):
+        widget = event.widget
+        text = self._tooltip_texts.get(str(widget))
+        if text is None:
+            return
+        self._hide_tooltip(event)
+        self._tooltip = tk.Toplevel(widget)
+        self._tooltip.wm_overrideredirect(True)
+        x = widget.winfo_rootx() + 20
+        y = widget.winfo_rooty() + 20
+        self._tooltip.wm_geometry(f"+{x}+{y}")
+        label = tk.Label(self._tooltip, text=text, background="#333", foreground="#fff", relief="solid", borderwidth=1, font=("Helvetica", 9))
+        label.pack(ipadx=4, ipady=2)
+
+    def _hide_tooltip(self, event):
+        if self._tooltip:
+            self._tooltip.destroy()
+            self._tooltip = None
 
     def create_output_panel(self, parent):
         output_frame = ttk.Frame(parent)
@@ -407,8 +699,19 @@ class FlarePieApp:
 
         self.setup_realtime_view()
 
-        self.setup_static_charts()
+        # The charts and data tabs start hidden; build them the first time they are shown or needed
+        self._output_tabs_built = False
+        self.tab_control.bind("<<NotebookTabChanged>>", self._on_output_tab_changed)
+
+    def _on_output_tab_changed(self, event):
+        if self.tab_control.index("current") != 0:
+            self._ensure_output_tabs()
 
+    def _ensure_output_tabs(self):
+        if self._output_tabs_built:
+            return
+        self._output_tabs_built = True
+        self.setup_static_charts()
         self.setup_data_view()
 
     def setup_realtime_view(self):
@@ -452,8 +755,9 @@ class FlarePieApp:
 
         self.rt_fig.tight_layout()
 
+        # No draw() here: the canvas renders on its first <Configure>, once it has its real size.
+        # Drawing now would render at the 8x6 default only to be thrown away on that resize.
         self.rt_canvas = FigureCanvasTkAgg(self.rt_fig, master=self.realtime_tab)
-        self.rt_canvas.draw()
         self.rt_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
         metrics_frame = tk.Frame(self.realtime_tab, bg="#1B263B")
@@ -464,22 +768,10 @@ class FlarePieApp:
         metric_units = ["s", "m/s", "m", "kg", "N"]
 
         for i, (name, unit) in enumerate(zip(metric_names, metric_units)):
-            lbl = tk.Label(
-                metrics_frame,
-                text=f"{name}:",
-                bg="#1B263B",
-                fg="white",
-                font=("Helvetica", 10, "bold")
-            )
+            lbl = ttk.Label(metrics_frame, text=f"{name}:", style="MetricName.TLabel")
             lbl.grid(row=0, column=i * 2, padx=5, pady=3, sticky='e')
 
-            value = tk.Label(
-                metrics_frame,
-                text=f"0.0 {unit}",
-                bg="#1B263B",
-                fg="cyan",
-                font=("Helvetica", 10)
-            )
+            value = ttk.Label(metrics_frame, text=f"0.0 {unit}", style="MetricValue.TLabel")
             value.grid(row=0, column=i * 2 + 1, padx=5, pady=3, sticky='w')
 
             self.metrics[name.lower()] = value
@@ -513,7 +805,6 @@ class FlarePieApp:
         self.perf_fig.tight_layout()
 
         self.perf_canvas = FigureCanvasTkAgg(self.perf_fig, master=perf_tab)
-        self.perf_canvas.draw()
         self.perf_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
         self.traj_fig = Figure(figsize=(8, 6))
@@ -539,7 +830,6 @@ class FlarePieApp:
         self.traj_fig.tight_layout()
 
         self.traj_canvas = FigureCanvasTkAgg(self.traj_fig, master=traj_tab)
-        self.traj_canvas.draw()
         self.traj_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
     def setup_data_view(self):
@@ -568,7 +858,6 @@ class FlarePieApp:
         self.summary_fig.tight_layout()
 
         self.summary_canvas = FigureCanvasTkAgg(self.summary_fig, master=summary_frame)
-        self.summary_canvas.draw()
         self.summary_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
         button_frame = ttk.Frame(self.data_tab)
@@ -584,185 +873,104 @@ class FlarePieApp:
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
 
-        status_bar = tk.Label(
-            self.root,
-            textvariable=self.status_var,
-            bd=1, relief=tk.SUNKEN, anchor=tk.W,
-            bg="#1B263B", fg="#E0E1DD"
-        )
+        status_bar = ttk.Label(self.root, textvariable=self.status_var, style="Status.TLabel")
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
     def run_rocket_simulation(self):
+        if self._sim_future is not None:
+            # A run is already in flight; its results will be shown when it finishes
+            return
+        fuel_type = self.rocket_vars["fuel_type"].get()
+        enable_failure = self.enable_failure_var.get()
+        enable_abort = self.enable_abort_var.get()
+
+        # Disabled failure/abort fields are not read, so leftovers in them can't block a run
+        texts = [self.rocket_vars[key].get() for key in _ROCKET_NUMERIC_KEYS]
+        texts.append((self.nozzle_vars.get("mfr") or self.rocket_vars["mfr"]).get())
+        texts.append(self.failure_time_var.get() if enable_failure else "0")
+        texts += [var.get() if enable_abort else "0"
+                  for var in (self.abort_time_var, self.parachute_area_var, self.parachute_cd_var)]
+        values = parse_floats(texts)
+        if values is None:
+            messagebox.showerror("Input Error", "Please enter valid numeric values")
+            self.status_var.set("Simulation failed")
+            return
+        (cocp, ct, altitude, intmass, propmass, dt, reference_area, mfr,
+         failure_time, abort_time, parachute_area, parachute_cd) = values
+        if not enable_failure:
+            failure_time = None
+        if not enable_abort:
+            abort_time = None
+
+        if fuel_type not in FUEL_TYPES:
+            messagebox.showerror("Input Error", "Invalid fuel type")
+            return
+
+        self.status_var.set("Running simulation...")
+
+        # Integrate on the worker thread; the Tk loop keeps handling events and polls for the result
+        self._sim_future = self._sim_executor.submit(
+            simulate_trajectory, fuel_type, cocp, ct, altitude, intmass, propmass, mfr, dt, reference_area,
+            failure_time, abort_time, parachute_area, parachute_cd
+        )
+        self.root.after(self.SIM_POLL_MS, self._poll_simulation)
+
+    def _poll_simulation(self):
+        future = self._sim_future
+        if not future.done():
+            self.root.after(self.SIM_POLL_MS, self._poll_simulation)
+            return
+        self._sim_future = None
         try:
-            fuel_type = self.rocket_vars["fuel_type"].get()
-            cocp = float(self.rocket_vars["cocp"].get())
-            ct = float(self.rocket_vars["ct"].get())
-            altitude = float(self.rocket_vars["altitude"].get())
-            intmass = float(self.rocket_vars["intmass"].get())
-            propmass = float(self.rocket_vars["propmass"].get())
-            mfr = float(self.nozzle_vars["mfr"].get()) if "mfr" in self.nozzle_vars else float(self.rocket_vars["mfr"].get())
-            dt = float(self.rocket_vars["dt"].get())
-            reference_area = float(self.rocket_vars["reference_area"].get())
-
-            enable_failure = self.enable_failure_var.get()
-            enable_abort = self.enable_abort_var.get()
-            failure_time = float(self.failure_time_var.get()) if enable_failure else None
-            abort_time = float(self.abort_time_var.get()) if enable_abort else None
-            parachute_area = float(self.parachute_area_var.get()) if enable_abort else 0.0
-            parachute_cd = float(self.parachute_cd_var.get()) if enable_abort else 0.0
-
-            if fuel_type not in ["RP1", "LH2", "SRF", "N2O4"]:
-                messagebox.showerror("Input Error", "Invalid fuel type")
-                return
-
-            self.status_var.set("Running simulation...")
-
-            from Engine import get_atmospheric_pressure, calculate_drag
-            k, R = {"RP1": (1.2, 287.0), "LH2": (1.4, 4124.0), "SRF": (1.2, 191.0), "N2O4": (1.26, 320.0)}[fuel_type]
-            current_mass = intmass
-            time_elapsed = 0.0
-            velocity = 0.0
-            current_altitude = altitude
-            delta_v = 0.0
-            energy_values = []
-            drag_values = []
-            acceleration_values = []
-            time_steps = []
-            thrust_values = []
-            fuel_remaining = []
-            mass_flow_values = []
-            velocity_values = []
-            altitude_values = []
-            isp_values = []
-            failure_event_idx = None
-            abort_event_idx = None
-            abort_triggered = False
-            max_time = 10000.0
-            max_iterations = 200000
-            iterations = 0
-            while (propmass > 0 or (abort_triggered and current_altitude > 0.5 and abs(velocity) > 0.5)) and time_elapsed < max_time and iterations < max_iterations:
-                ap = get_atmospheric_pressure(current_altitude)
-                pressure_ratio = (ap / cocp) ** ((k - 1) / k) if cocp > 0 else 0.0
-                ve = (2.0 * k) / (k - 1.0) * R * ct * (1.0 - pressure_ratio)
-                ve = max(0.0, ve) ** 0.5
-                thrust = mfr * ve
-                if enable_failure and failure_time is not None and time_elapsed >= failure_time:
-                    if failure_event_idx is None:
-                        failure_event_idx = len(time_steps)
-                    thrust = 0.0
-                    mfr = 0.0
-                if enable_abort and abort_time is not None and time_elapsed >= abort_time:
-                    if abort_event_idx is None:
-                        abort_event_idx = len(time_steps)
-                        abort_triggered = True
-                    thrust = 0.0
-                    mfr = 0.0
-                mass_used = min(mfr * dt, propmass)
-                propmass -= mass_used
-                current_mass -= mass_used
-                if abort_triggered:
-                    p0 = 1.225
-                    h0 = 8500
-                    density = p0 * math.exp(-current_altitude / h0)
-                    drag = 0.5 * density * velocity ** 2 * parachute_area * parachute_cd * (-1 if velocity > 0 else 1)
-                else:
-                    drag = calculate_drag(velocity, current_altitude, reference_area)
-                acceleration = (thrust / current_mass) - 9.81 - (drag / current_mass)
-                velocity_mid = velocity + 0.5 * acceleration * dt
-                altitude_mid = current_altitude + 0.5 * velocity * dt
-                if abort_triggered:
-                    density_mid = p0 * math.exp(-altitude_mid / h0)
-                    drag_mid = 0.5 * density_mid * velocity_mid ** 2 * parachute_area * parachute_cd * (-1 if velocity_mid > 0 else 1)
-                else:
-                    drag_mid = calculate_drag(velocity_mid, altitude_mid, reference_area)
-                acceleration_mid = (thrust / current_mass) - 9.81 - (drag_mid / current_mass)
-                velocity_new = velocity + acceleration_mid * dt
-                altitude_new = current_altitude + velocity_mid * dt
-                delta_v_step = max(0.0, velocity_new - velocity)
-                delta_v += delta_v_step
-                kinetic_energy = 0.5 * current_mass * velocity ** 2
-                potential_energy = current_mass * 9.81 * current_altitude
-                energy_values.append(kinetic_energy + potential_energy)
-                isp = thrust / (mfr * 9.81) if mfr > 0 else 0.0
-                time_steps.append(time_elapsed)
-                thrust_values.append(thrust)
-                fuel_remaining.append(propmass)
-                mass_flow_values.append(mfr)
-                velocity_values.append(velocity)
-                altitude_values.append(current_altitude)
-                isp_values.append(isp)
-                drag_values.append(drag)
-                acceleration_values.append(acceleration)
-                velocity = velocity_new
-                current_altitude = altitude_new
-                time_elapsed += dt
-                iterations += 1
-                # Ensure after abort, rocket lands
-                if abort_triggered and current_altitude <= 0:
-                    break
-                if thrust == 0.0 and propmass <= 0 and not abort_triggered:
-                    break
-            results = {
-                "time": time_steps,
-                "thrust": thrust_values,
-                "fuel_remaining": fuel_remaining,
-                "mass_flow": mass_flow_values,
-                "velocity": velocity_values,
-                "altitude": altitude_values,
-                "isp_values": isp_values,
-                "energy": energy_values,
-                "drag": drag_values,
-                "acceleration": acceleration_values,
-                "final_time": time_elapsed,
-                "initial_thrust": thrust_values[0] if thrust_values else 0,
-                "delta_v": delta_v,
-                "simulation_complete": True,
-                "failure_event_idx": failure_event_idx,
-                "abort_event_idx": abort_event_idx
-            }
-            self.simulation_data = results
-            self.update_static_charts(results)
-            self.update_data_view(results)
-            if self.animate_var.get():
-                self.start_animation(results)
-            if self.save_var.get():
-                self.save_results(results)
-            self.status_var.set("Simulation complete")
+            results = future.result()
         except ValueError as e:
             messagebox.showerror("Input Error", f"Please enter valid numeric values: {str(e)}")
             self.status_var.set("Simulation failed")
+            return
+
+        self.simulation_data = results
+        self.update_static_charts(results)
+        self.update_data_view(results)
+        if self.animate_var.get():
+            self.start_animation(results)
+        if self.save_var.get():
+            self.save_results(results)
+        self.status_var.set("Simulation complete")
 
     def run_nozzle_analysis(self):
-        try:
-            mfr = float(self.nozzle_vars["mfr"].get())
-            ve = float(self.nozzle_vars["ve"].get())
-            expa = float(self.nozzle_vars["expa"].get())
-            amp = float(self.nozzle_vars["amp"].get())
-            ea = float(self.nozzle_vars["ea"].get())
+        values = parse_floats(self.nozzle_vars[key].get() for key in ("mfr", "ve", "expa", "amp", "ea"))
+        if values is None:
+            messagebox.showerror("Input Error", "Please enter valid numeric values")
+            self.status_var.set("Nozzle analysis failed")
+            return
+        mfr, ve, expa, amp, ea = values
 
-            self.status_var.set("Calculating nozzle performance...")
+        self.status_var.set("Calculating nozzle performance...")
 
+        try:
             results = nozzle_performance(mfr, ve, expa, amp, ea)
+        except ValueError as e:
+            # e.g. a negative pressure ratio reaching the efficiency log
+            messagebox.showerror("Input Error", f"Please enter valid numeric values: {str(e)}")
+            self.status_var.set("Nozzle analysis failed")
+            return
 
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, "=== NOZZLE PERFORMANCE RESULTS ===\n\n")
-            self.result_text.insert(tk.END, f"Total Thrust: {results['thrust']:.2f} N\n")
-            self.result_text.insert(tk.END, f"Specific Impulse: {results['isp']:.2f} s\n")
-            self.result_text.insert(tk.END, f"Pressure Thrust: {results['pressure_thrust']:.2f} N\n")
-            self.result_text.insert(tk.END, f"Momentum Thrust: {results['momentum_thrust']:.2f} N\n")
-
-            self.update_nozzle_summary(results)
+        self._ensure_output_tabs()
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, "=== NOZZLE PERFORMANCE RESULTS ===\n\n")
+        self.result_text.insert(tk.END, f"Total Thrust: {results['thrust']:.2f} N\n")
+        self.result_text.insert(tk.END, f"Specific Impulse: {results['isp']:.2f} s\n")
+        self.result_text.insert(tk.END, f"Pressure Thrust: {results['pressure_thrust']:.2f} N\n")
+        self.result_text.insert(tk.END, f"Momentum Thrust: {results['momentum_thrust']:.2f} N\n")
 
-            if self.save_var.get():
-                self.save_nozzle_results(results)
+        self.update_nozzle_summary(results)
 
-            self.tab_control.select(2)
+        if self.save_var.get():
+            self.save_nozzle_results(results)
 
-            self.status_var.set("Nozzle analysis complete")
+        self.tab_control.select(2)
 
-        except ValueError as e:
-            messagebox.showerror("Input Error", f"Please enter valid numeric values: {str(e)}")
-            self.status_var.set("Nozzle analysis failed")
+        self.status_var.set("Nozzle analysis complete")
 
     def start_animation(self, results):
         self.stop_animation()
@@ -791,9 +999,11 @@ class FlarePieApp:
         self.rt_ax4.set_xlim(0, max_time * 1.1)
         self.rt_ax4.set_ylim(0, max_thrust * 1.1)
 
+        # Frames past 100 hold the full trajectory; end indices are fixed per run
+        frame_ends = np.maximum(1, len(time_data) * np.minimum(np.arange(120), 100) // 100)
+
         def animate(i):
-            progress = min(1.0, i / 100)
-            end_idx = max(1, int(len(time_data) * progress))
+            end_idx = frame_ends[i]
 
             self.velocity_line.set_data(time_data[:end_idx], velocity_data[:end_idx])
             self.altitude_line.set_data(time_data[:end_idx], altitude_data[:end_idx])
@@ -813,7 +1023,7 @@ class FlarePieApp:
         self.animation = FuncAnimation(
             self.rt_fig,
             animate,
-            frames=120,
+            frames=len(frame_ends),
             interval=50,
             blit=True,
             repeat=False
@@ -832,6 +1042,7 @@ class FlarePieApp:
             self.animation = None
 
     def update_static_charts(self, results):
+        self._ensure_output_tabs()
         time_data = results['time']
         thrust_data = results['thrust']
         isp_data = results['isp_values']
@@ -958,6 +1169,7 @@ class FlarePieApp:
         self.traj_canvas.draw()
 
     def update_data_view(self, results):
+        self._ensure_output_tabs()
         self.result_text.delete(1.0, tk.END)
 
         self.result_text.insert(tk.END, "┌─────────────────────────────────────────────┐\n")
@@ -1031,6 +1243,7 @@ class FlarePieApp:
         self.summary_canvas.draw()
 
     def update_nozzle_summary(self, results):
+        self._ensure_output_tabs()
         self.summary_ax.clear()
 
         metrics = ['Total Thrust', 'Pressure Thrust', 'Momentum Thrust', 'ISP']
@@ -1140,6 +1353,24 @@ class FlarePieApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate report: {str(e)}")
 
+    def export_animation(self):
+        if not self.simulation_data:
+            messagebox.showwarning("Warning", "No simulation data to export")
+            return
+        
+        path = filedialog.asksaveasfilename(defaultextension=".gif", filetypes=[("GIF Files", "*.gif")])
+        if not path:
+            return
+        
+        try:
+            self.status_var.set("Rendering animation...")
+            export_trajectory_animation(self.simulation_data, path)
+            self.status_var.set("Animation exported")
+            messagebox.showinfo("Success", f"Animation saved: {path}")
+        except Exception as e:
+            self.status_var.set("Animation export failed")
+            messagebox.showerror("Error", f"Failed to export animation: {str(e)}")
+
     def undo(self):
         if self.undo_stack:
             # Placeholder for undo functionality
@@ -1261,33 +1492,11 @@ class FlarePieApp:
             return
         win = tk.Toplevel(self.root)
         win.title("3D Trajectory Visualization")
-        try:
-            win.iconbitmap(self.get_icon_path())
-        except Exception:
-            pass
         fig = Figure(figsize=(8, 6))
-        ax = fig.add_subplot(111, projection='3d')
-        time_data = self.simulation_data['time']
-        altitude_data = self.simulation_data['altitude']
-        velocity_data = self.simulation_data['velocity']
-        line, = ax.plot([], [], [], color='cyan', linewidth=2)
-        ax.set_xlabel('Time (s)')
-        ax.set_ylabel('Velocity (m/s)')
-        ax.set_zlabel('Altitude (m)')  # type: ignore[attr-defined]
-        ax.set_title('3D Trajectory (Time, Velocity, Altitude)')
-        ax.grid(True)
-        ax.set_xlim(float(min(time_data)), float(max(time_data)))
-        ax.set_ylim(float(min(velocity_data)), float(max(velocity_data)))
-        ax.set_zlim(float(min(altitude_data)), float(max(altitude_data)))  # type: ignore[attr-defined]
         canvas = FigureCanvasTkAgg(fig, master=win)
-        canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        def animate(i):
-            idx = max(1, int(len(time_data) * i / 100))
-            line.set_data(time_data[:idx], velocity_data[:idx])
-            line.set_3d_properties(altitude_data[:idx])  # type: ignore[attr-defined]
-            return line,
-        anim = FuncAnimation(fig, animate, frames=100, interval=50, blit=True, repeat=False)
+        frames = build_trajectory_frames(fig, self.simulation_data)
+        win.animation = ArtistAnimation(fig, frames, interval=50, blit=True, repeat=False)
         canvas.draw()
 
     def show_performance_dashboard(self):
@@ -1297,10 +1506,6 @@ class FlarePieApp:
         
         dash_win = tk.Toplevel(self.root)
         dash_win.title("Performance Dashboard")
-        try:
-            dash_win.iconbitmap(self.get_icon_path())
-        except Exception:
-            pass
         tk.Label(dash_win, text="Performance dashboard not implemented yet").pack(padx=20, pady=20)
 
     def show_mission_timeline(self):
@@ -1311,20 +1516,11 @@ class FlarePieApp:
         
         timeline_win = tk.Toplevel(self.root)
         timeline_win.title("Mission Timeline")
-        try:
-            timeline_win.iconbitmap(self.get_icon_path())
-        except Exception:
-            pass
         tk.Label(timeline_win, text="Mission timeline not implemented yet").pack(padx=20, pady=20)
 
     def show_earth_trajectory(self):
-        import numpy as np
-        import matplotlib.pyplot as plt
-        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-        from mpl_toolkits.mplot3d import Axes3D
-        from matplotlib.animation import FuncAnimation
-        import os
-        import urllib.request
+        # Loading art3d also registers the "3d" projection
+        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
         if not self.simulation_data:
             messagebox.showwarning("Warning", "No simulation data available")
             return
@@ -1333,42 +1529,26 @@ class FlarePieApp:
         lon0 = np.radians(-80.6077)
         alt = np.array(self.simulation_data['altitude'])
         time = np.array(self.simulation_data['time'])
-        lat = np.full_like(alt, lat0)
-        lon = np.full_like(alt, lon0)
-        x = (R_earth + alt) * np.cos(lat) * np.cos(lon)
-        y = (R_earth + alt) * np.cos(lat) * np.sin(lon)
-        z = (R_earth + alt) * np.sin(lat)
-        xg = R_earth * np.cos(lat) * np.cos(lon)
-        yg = R_earth * np.cos(lat) * np.sin(lon)
-        zg = R_earth * np.sin(lat)
+        # Vertical ascent: latitude and longitude are fixed, so the direction is a constant unit vector
+        cos_lat, sin_lat = np.cos(lat0), np.sin(lat0)
+        up = np.array([cos_lat * np.cos(lon0), cos_lat * np.sin(lon0), sin_lat])
+        radius = R_earth + alt
+        x = radius * up[0]
+        y = radius * up[1]
+        z = radius * up[2]
+        xg, yg, zg = R_earth * up
         win = tk.Toplevel(self.root)
         win.title("3D Earth Trajectory Animation")
-        fig = plt.figure(figsize=(8, 7))
+        fig = Figure(figsize=(8, 7))
         ax = fig.add_subplot(111, projection='3d')
-        texture_path = "earth_texture.png"
-        if not os.path.exists(texture_path):
-            url = "https://eoimages.gsfc.nasa.gov/images/imagerecords/57000/57730/land_ocean_ice_2048.png"
-            urllib.request.urlretrieve(url, texture_path)
-        img = plt.imread(texture_path)
-        # High-res sphere
-        n = 200
-        u = np.linspace(0, 2 * np.pi, n)
-        v = np.linspace(0, np.pi, n//2)
-        u, v = np.meshgrid(u, v)
-        xe = R_earth * np.cos(u) * np.sin(v)
-        ye = R_earth * np.sin(u) * np.sin(v)
-        ze = R_earth * np.cos(v)
-        # Map texture
-        lon_img = (u / (2 * np.pi) * img.shape[1]).astype(int) % img.shape[1]
-        lat_img = (v / np.pi * img.shape[0]).astype(int) % img.shape[0]
-        facecolors = img[lat_img, lon_img] / 255.0
-        ax.plot_surface(xe, ye, ze, rstride=2, cstride=2, facecolors=facecolors, linewidth=0, antialiased=False, shade=True)  # type: ignore[attr-defined]
+        verts, facecolors = get_earth_sphere(R_earth)
+        ax.add_collection3d(Poly3DCollection(verts, facecolors=facecolors, linewidths=0, antialiased=False))  # type: ignore[attr-defined]
         eq_u = np.linspace(0, 2 * np.pi, 400)
         ax.plot(R_earth * np.cos(eq_u), R_earth * np.sin(eq_u), 0, color='w', linewidth=1, alpha=0.7)
 
         ax.plot([0, 0], [0, 0], [-R_earth, R_earth], color='w', linewidth=1, alpha=0.7)
-        ax.plot(xg, yg, zg, color='yellow', linewidth=2, label='Ground Track')
-        traj_line, = ax.plot([], [], [], color='red', linewidth=2, label='Trajectory')
+        ax.plot([xg], [yg], [zg], color='yellow', marker='o', linestyle='none', label='Launch Site')
+        ax.plot([], [], [], color='red', linewidth=2, label='Trajectory')
         max_alt = max(alt) if len(alt) else 1000
         ax.set_xlim(-R_earth*1.1, R_earth*1.1)
         ax.set_ylim(-R_earth*1.1, R_earth*1.1)
@@ -1379,15 +1559,15 @@ class FlarePieApp:
         ax.set_title('3D Trajectory over Earth', fontsize=14, fontweight='bold')
         ax.legend(loc='upper left')
         ax.grid(False)
-        def animate(i):
-            idx = max(1, int(len(x) * i / 100))
-            traj_line.set_data(x[:idx], y[:idx])
-            traj_line.set_3d_properties(z[:idx])  # type: ignore[attr-defined]
-            return traj_line,
-        anim = FuncAnimation(fig, animate, frames=100, interval=50, blit=True, repeat=False)
+        frames = [
+            ax.plot(x[idx], y[idx], z[idx], color='red', linewidth=2, animated=True)
+            for idx in trajectory_frame_indices(len(x))
+        ]
+        # The Tk canvas must exist before the animation so it gets a real timer
         canvas = FigureCanvasTkAgg(fig, master=win)
-        canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        win.animation = ArtistAnimation(fig, frames, interval=50, blit=True, repeat=False)
+        canvas.draw()
 
     def show_manual(self):
         manual_text = """
@@ -1409,11 +1589,7 @@ class FlarePieApp:
         """
         manual_win = tk.Toplevel(self.root)
         manual_win.title("User Manual")
-        try:
-            manual_win.iconbitmap(self.get_icon_path())
-        except Exception:
-            pass
-        tk.Label(manual_win, text=manual_text, justify='left', font=("Helvetica", 10)).pack(padx=20, pady=20)
+        tk.Label(manual_win, text=manual_text, justify='left', font=self.body_font).pack(padx=20, pady=20)
 
     def show_about(self):
         about_text = """
@@ -1434,22 +1610,12 @@ class FlarePieApp:
         """
         about_win = tk.Toplevel(self.root)
         about_win.title("About FlarePie")
-        try:
-            about_win.iconbitmap(self.get_icon_path())
-        except Exception:
-            pass
-        tk.Label(about_win, text=about_text, justify='left', font=("Helvetica", 10)).pack(padx=20, pady=20)
+        tk.Label(about_win, text=about_text, justify='left', font=self.body_font).pack(padx=20, pady=20)
 
     def open_nozzle_designer(self):
-        import matplotlib.pyplot as plt
-        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         import json
         win = tk.Toplevel(self.root)
         win.title("Advanced Engine/Nozzle Designer")
-        try:
-            win.iconbitmap(self.get_icon_path())
-        except Exception:
-            pass
         materials = {
             "Steel": {"density": 7850, "max_temp": 1700},
             "Aluminum": {"density": 2700, "max_temp": 900},
@@ -1459,38 +1625,26 @@ class FlarePieApp:
         }
         param_frame = ttk.Frame(win)
         param_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
-        ttk.Label(param_frame, text="Chamber Radius (m):").grid(row=0, column=0, sticky='w')
-        chamber_r_var = tk.StringVar(value="0.25")
-        ttk.Entry(param_frame, textvariable=chamber_r_var, width=10).grid(row=0, column=1)
-        ttk.Label(param_frame, text="Throat Radius (m):").grid(row=1, column=0, sticky='w')
-        throat_r_var = tk.StringVar(value="0.1")
-        ttk.Entry(param_frame, textvariable=throat_r_var, width=10).grid(row=1, column=1)
-        ttk.Label(param_frame, text="Exit Radius (m):").grid(row=2, column=0, sticky='w')
-        exit_r_var = tk.StringVar(value="0.3")
-        ttk.Entry(param_frame, textvariable=exit_r_var, width=10).grid(row=2, column=1)
-        ttk.Label(param_frame, text="Nozzle Length (m):").grid(row=3, column=0, sticky='w')
-        length_var = tk.StringVar(value="1.0")
-        ttk.Entry(param_frame, textvariable=length_var, width=10).grid(row=3, column=1)
-        ttk.Label(param_frame, text="Nozzle Angle (deg):").grid(row=4, column=0, sticky='w')
-        angle_var = tk.StringVar(value="15.0")
-        ttk.Entry(param_frame, textvariable=angle_var, width=10).grid(row=4, column=1)
-        ttk.Label(param_frame, text="Wall Thickness (m):").grid(row=5, column=0, sticky='w')
-        wall_var = tk.StringVar(value="0.01")
-        ttk.Entry(param_frame, textvariable=wall_var, width=10).grid(row=5, column=1)
+        design_vars = {}
+        for row, (label_text, key, default) in enumerate(NOZZLE_DESIGN_FIELDS):
+            ttk.Label(param_frame, text=label_text).grid(row=row, column=0, sticky='w')
+            var = tk.StringVar(value=default)
+            ttk.Entry(param_frame, textvariable=var, width=10,
+                      validate="key", validatecommand=self._numeric_vcmd).grid(row=row, column=1)
+            design_vars[key] = var
+        chamber_r_var = design_vars["chamber_r"]
+        throat_r_var = design_vars["throat_r"]
+        exit_r_var = design_vars["exit_r"]
+        length_var = design_vars["length"]
+        angle_var = design_vars["angle"]
+        wall_var = design_vars["wall"]
         ttk.Label(param_frame, text="Material:").grid(row=6, column=0, sticky='w')
         material_var = tk.StringVar(value="Steel")
         material_menu = ttk.Combobox(param_frame, textvariable=material_var, values=list(materials.keys()), state="readonly", width=10)
         material_menu.grid(row=6, column=1)
         def save_design():
-            design = {
-                "chamber_r": chamber_r_var.get(),
-                "throat_r": throat_r_var.get(),
-                "exit_r": exit_r_var.get(),
-                "length": length_var.get(),
-                "angle": angle_var.get(),
-                "wall": wall_var.get(),
-                "material": material_var.get()
-            }
+            design = {key: var.get() for key, var in design_vars.items()}
+            design["material"] = material_var.get()
             file = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON Files", "*.json")])
             if file:
                 with open(file, 'w') as f:
@@ -1500,12 +1654,8 @@ class FlarePieApp:
             if file:
                 with open(file, 'r') as f:
                     design = json.load(f)
-                chamber_r_var.set(design.get("chamber_r", "0.25"))
-                throat_r_var.set(design.get("throat_r", "0.1"))
-                exit_r_var.set(design.get("exit_r", "0.3"))
-                length_var.set(design.get("length", "1.0"))
-                angle_var.set(design.get("angle", "15.0"))
-                wall_var.set(design.get("wall", "0.01"))
+                for _, key, default in NOZZLE_DESIGN_FIELDS:
+                    design_vars[key].set(design.get(key, default))
                 material_var.set(design.get("material", "Steel"))
         ttk.Button(param_frame, text="Save Design", command=save_design).grid(row=7, column=0, pady=5)
         ttk.Button(param_frame, text="Load Design", command=load_design).grid(row=7, column=1, pady=5)
@@ -1516,9 +1666,17 @@ class FlarePieApp:
         metrics_label.pack(anchor='w', padx=5, pady=5)
         plot_frame = ttk.Frame(win)
         plot_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        fig, ax = plt.subplots(figsize=(4, 7))
+        fig = Figure(figsize=(4, 7))
+        ax = fig.subplots()
         canvas = FigureCanvasTkAgg(fig, master=plot_frame)
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        outer_r_line, = ax.plot([], [], color='blue', lw=2)
+        outer_l_line, = ax.plot([], [], color='blue', lw=2)
+        inner_r_line, = ax.plot([], [], color='gray', lw=1)
+        inner_l_line, = ax.plot([], [], color='gray', lw=1)
+        ax.set_aspect('equal')
+        ax.set_title('Nozzle Schematic')
+        ax.axis('off')
         def update_plot_and_metrics(*args):
             try:
                 chamber_r = float(chamber_r_var.get())
@@ -1528,17 +1686,14 @@ class FlarePieApp:
                 angle = float(angle_var.get())
                 wall = float(wall_var.get())
                 mat = material_var.get()
-                ax.clear()
-                ax.plot([chamber_r, throat_r, exit_r, 0], [0, length*0.2, length, length], color='blue', lw=2)
-                ax.plot([-chamber_r, -throat_r, -exit_r, 0], [0, length*0.2, length, length], color='blue', lw=2)
-                ax.plot([chamber_r-wall, throat_r-wall, exit_r-wall, 0], [0, length*0.2, length, length], color='gray', lw=1)
-                ax.plot([-(chamber_r-wall), -(throat_r-wall), -(exit_r-wall), 0], [0, length*0.2, length, length], color='gray', lw=1)
+                profile_y = [0, length*0.2, length, length]
+                outer_r_line.set_data([chamber_r, throat_r, exit_r, 0], profile_y)
+                outer_l_line.set_data([-chamber_r, -throat_r, -exit_r, 0], profile_y)
+                inner_r_line.set_data([chamber_r-wall, throat_r-wall, exit_r-wall, 0], profile_y)
+                inner_l_line.set_data([-(chamber_r-wall), -(throat_r-wall), -(exit_r-wall), 0], profile_y)
                 ax.set_xlim(-exit_r*1.2, exit_r*1.2)
                 ax.set_ylim(-0.1, length+0.1)
-                ax.set_aspect('equal')
-                ax.set_title('Nozzle Schematic')
-                ax.axis('off')
-                canvas.draw()
+                canvas.draw_idle()
                 area_throat = 3.14159 * (throat_r)**2
                 area_exit = 3.14159 * (exit_r)**2
                 area_chamber = 3.14159 * (chamber_r)**2
@@ -1557,8 +1712,15 @@ class FlarePieApp:
                 metrics_text.set(metrics)
             except Exception as e:
                 metrics_text.set(f"Error: {e}")
-        for var in [chamber_r_var, throat_r_var, exit_r_var, length_var, angle_var, wall_var, material_var]:
-            var.trace_add('write', update_plot_and_metrics)
+        # Redraw once typing pauses rather than on every keystroke
+        pending_redraw = None
+        def schedule_update(*args):
+            nonlocal pending_redraw
+            if pending_redraw is not None:
+                win.after_cancel(pending_redraw)
+            pending_redraw = win.after(150, update_plot_and_metrics)
+        for var in [*design_vars.values(), material_var]:
+            var.trace_add('write', schedule_update)
         update_plot_and_metrics()
         def apply_to_sim():
             try:
@@ -1610,17 +1772,12 @@ class FlarePieApp:
             self.cgcp_result_var.set(f"Error: {e}")
 
     def get_icon_path(self):
-        import sys, os
-        if getattr(sys, 'frozen', False):
-            meipass = getattr(sys, '_MEIPASS', None)
-            if meipass is not None:
-                return os.path.join(meipass, 'logo.ico')
-        return 'logo.ico'
+        return get_icon_path()
 
 
 def main():
     root = tk.Tk()
-    app = FlarePieApp(root)
+    FlarePieApp(root)
     root.mainloop()
 
 
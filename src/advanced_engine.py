@@ -1,10 +1,38 @@
 import math
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
-from Engine import rocket_simulation, nozzle_performance, get_atmospheric_pressure
+from Engine import rocket_simulation, nozzle_performance, fast_atmospheric_pressure
+
+FUEL_PROPERTIES: Dict[str, Tuple[float, float]] = {
+    "RP1": (1.2, 287.0),
+    "LH2": (1.4, 4124.0),
+    "SRF": (1.2, 191.0),
+    "N2O4": (1.26, 320.0)
+}
+DEFAULT_FUEL_PROPERTIES = FUEL_PROPERTIES["RP1"]
+
+class _ArrayBuffer:
+    # Append-only typed buffer that doubles its storage when full
+
+    def __init__(self, dtype=np.float64, capacity: int = 1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._size = 0
+
+    def append(self, value):
+        if self._size == len(self._data):
+            self._data = np.resize(self._data, 2 * len(self._data))
+        self._data[self._size] = value
+        self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def to_list(self) -> list:
+        # Callers index and .index() the series like the lists this used to build
+        return self._data[:self._size].tolist()
 
 @dataclass
 class Stage:
@@ -21,6 +49,11 @@ class Stage:
     separation_time: Optional[float] = None
     fairing_mass: float = 0.0
     fairing_separation_altitude: Optional[float] = None
+    fuel_k: float = field(default=0.0, init=False)
+    fuel_R: float = field(default=0.0, init=False)
+
+    def __post_init__(self):
+        self.fuel_k, self.fuel_R = FUEL_PROPERTIES.get(self.fuel_type, DEFAULT_FUEL_PROPERTIES)
 
 @dataclass
 class OrbitalParameters:
@@ -33,6 +66,8 @@ class OrbitalParameters:
 
 class AdvancedRocketEngine:
 
+    DEFAULT_MAX_TIME = 3600.0
+
     def __init__(self):
         self.stages: List[Stage] = []
         self.current_stage = 0
@@ -46,29 +81,39 @@ class AdvancedRocketEngine:
         if not self.stages:
             return {"error": "No stages defined"}
         
-        time_data = []
-        altitude_data = []
-        velocity_data = []
-        mass_data = []
-        thrust_data = []
-        stage_data = []
+        time_data = _ArrayBuffer()
+        altitude_data = _ArrayBuffer()
+        velocity_data = _ArrayBuffer()
+        mass_data = _ArrayBuffer()
+        thrust_data = _ArrayBuffer()
+        stage_data = _ArrayBuffer(np.int8)
         events = []
         
         current_time = 0.0
         current_altitude = 0.0
         current_velocity = 0.0
-        current_mass = sum(stage.total_mass for stage in self.stages)
         
-        stage_masses = [stage.total_mass for stage in self.stages]
-        stage_propellants = [stage.propellant_mass for stage in self.stages]
-        stage_flow_rates = [stage.mass_flow_rate for stage in self.stages]
+        soa = self._pack_stages_soa()
+        current_mass = float(soa["total_mass"].sum())
+        stage_propellants = soa["propellant_mass"]
+        stage_flow_rates = soa["mass_flow_rate"]
+        
+        # Bound the loop: one iteration per time step, plus one per stage transition
+        # (separation/depletion `continue` without advancing time) and the final exit.
+        # ceil, not int: 0.3 / 0.1 is 2.999..., and the summed current_time can also
+        # land just under time_limit, so allow one extra step for that drift.
+        time_limit = max_time or self.DEFAULT_MAX_TIME
+        max_steps = math.ceil(time_limit / dt) + 1 + len(self.stages) + 1
         
-        while current_time < (max_time or float('inf')):
+        for _ in range(max_steps):
+            if current_time >= time_limit:
+                break
             if self.current_stage < len(self.stages):
-                stage = self.stages[self.current_stage]
+                i = self.current_stage
                 
-                if (stage.separation_altitude and current_altitude >= stage.separation_altitude) or \
-                   (stage.separation_time and current_time >= stage.separation_time):
+                # Disabled triggers are NaN, and any comparison against NaN is False
+                if current_altitude >= soa["separation_altitude"][i] or \
+                   current_time >= soa["separation_time"][i]:
                     events.append({
                         "time": current_time,
                         "type": "stage_separation",
@@ -95,19 +140,20 @@ class AdvancedRocketEngine:
                     stage.fairing_mass = 0
             
             if self.current_stage < len(self.stages):
-                stage = self.stages[self.current_stage]
+                i = self.current_stage
                 
-                ap = get_atmospheric_pressure(current_altitude)
-                k, R = self._get_fuel_properties(stage.fuel_type)
-                pressure_ratio = (ap / stage.chamber_pressure) ** ((k - 1) / k) if stage.chamber_pressure > 0 else 0.0
-                ve = math.sqrt((2.0 * k) / (k - 1.0) * R * stage.combustion_temp * (1.0 - pressure_ratio))
-                thrust = stage_flow_rates[self.current_stage] * ve
+                ap = fast_atmospheric_pressure(current_altitude)
+                k, R = soa["fuel_k"][i], soa["fuel_R"][i]
+                chamber_pressure = soa["chamber_pressure"][i]
+                pressure_ratio = (ap / chamber_pressure) ** ((k - 1) / k) if chamber_pressure > 0 else 0.0
+                ve = math.sqrt((2.0 * k) / (k - 1.0) * R * soa["combustion_temp"][i] * (1.0 - pressure_ratio))
+                thrust = stage_flow_rates[i] * ve
                 
-                mass_used = min(stage_flow_rates[self.current_stage] * dt, stage_propellants[self.current_stage])
-                stage_propellants[self.current_stage] -= mass_used
+                mass_used = min(stage_flow_rates[i] * dt, stage_propellants[i])
+                stage_propellants[i] -= mass_used
                 current_mass -= mass_used
                 
-                if stage_propellants[self.current_stage] <= 0:
+                if stage_propellants[i] <= 0:
                     events.append({
                         "time": current_time,
                         "type": "stage_depletion",
@@ -127,9 +173,11 @@ class AdvancedRocketEngine:
                 })
                 break
             
-            drag = self._calculate_drag(current_velocity, current_altitude,
-                                      self.stages[self.current_stage].reference_area)
-            acceleration = (thrust / current_mass) - 9.81 - (drag / current_mass)
+            reference_area = soa["reference_area"][self.current_stage]
+
+            def acceleration(v: float, h: float) -> float:
+                drag = self._calculate_drag(v, h, reference_area)
+                return (thrust / current_mass) - 9.81 - (drag / current_mass)
             
             velocity_new, altitude_new = self._rk4_integration(
                 current_velocity, current_altitude, acceleration, dt
@@ -146,34 +194,50 @@ class AdvancedRocketEngine:
             current_altitude = altitude_new
             current_time += dt
         
+        altitude = altitude_data.to_list()
+        velocity = velocity_data.to_list()
+        
         return {
-            "time": time_data,
-            "altitude": altitude_data,
-            "velocity": velocity_data,
-            "mass": mass_data,
-            "thrust": thrust_data,
-            "stage": stage_data,
+            "time": time_data.to_list(),
+            "altitude": altitude,
+            "velocity": velocity,
+            "mass": mass_data.to_list(),
+            "thrust": thrust_data.to_list(),
+            "stage": stage_data.to_list(),
             "events": events,
             "final_time": current_time,
-            "max_altitude": max(altitude_data) if altitude_data else 0,
-            "max_velocity": max(velocity_data) if velocity_data else 0
+            "max_altitude": max(altitude) if altitude else 0,
+            "max_velocity": max(velocity) if velocity else 0
         }
     
-    def _get_fuel_properties(self, fuel_type: str) -> Tuple[float, float]:
-        fuel_properties = {
-            "RP1": (1.2, 287.0),
-            "LH2": (1.4, 4124.0),
-            "SRF": (1.2, 191.0),
-            "N2O4": (1.26, 320.0)
+    def _pack_stages_soa(self) -> Dict[str, np.ndarray]:
+        count = len(self.stages)
+
+        def column(values) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=count)
+
+        return {
+            "total_mass": column(stage.total_mass for stage in self.stages),
+            "propellant_mass": column(stage.propellant_mass for stage in self.stages),
+            "mass_flow_rate": column(stage.mass_flow_rate for stage in self.stages),
+            "chamber_pressure": column(stage.chamber_pressure for stage in self.stages),
+            "combustion_temp": column(stage.combustion_temp for stage in self.stages),
+            "reference_area": column(stage.reference_area for stage in self.stages),
+            "fuel_k": column(stage.fuel_k for stage in self.stages),
+            "fuel_R": column(stage.fuel_R for stage in self.stages),
+            "separation_altitude": column(stage.separation_altitude or np.nan for stage in self.stages),
+            "separation_time": column(stage.separation_time or np.nan for stage in self.stages),
         }
-        return fuel_properties.get(fuel_type, (1.2, 287.0))
+    
+    def _get_fuel_properties(self, fuel_type: str) -> Tuple[float, float]:
+        return FUEL_PROPERTIES.get(fuel_type, DEFAULT_FUEL_PROPERTIES)
     
     def _calculate_drag(self, velocity: float, altitude: float, reference_area: float) -> float:
         p0 = 1.225
         h0 = 8500
         density = p0 * math.exp(-altitude / h0)
         
-        speed_of_sound = 340.0 * math.sqrt(get_atmospheric_pressure(altitude) / 101325.0)
+        speed_of_sound = 340.0 * math.sqrt(fast_atmospheric_pressure(altitude) / 101325.0)
         mach = abs(velocity) / max(speed_of_sound, 0.1)
         
         if mach < 0.8:
@@ -186,24 +250,23 @@ class AdvancedRocketEngine:
         drag = 0.5 * density * velocity ** 2 * reference_area * cd
         return drag if velocity > 0 else -drag
     
-    def _rk4_integration(self, v: float, h: float, a: float, dt: float) -> Tuple[float, float]:
+    def _rk4_integration(self, v: float, h: float, accel: Callable[[float, float], float],
+                         dt: float) -> Tuple[float, float]:
 
-        k1_v = a * dt
-        k1_h = v * dt
-        
+        k1_v = accel(v, h)
+        k1_h = v
 
-        k2_v = a * dt
-        k2_h = (v + 0.5 * k1_v) * dt
-        
+        k2_v = accel(v + 0.5 * dt * k1_v, h + 0.5 * dt * k1_h)
+        k2_h = v + 0.5 * dt * k1_v
 
-        k3_v = a * dt
-        k3_h = (v + 0.5 * k2_v) * dt
-        
-        k4_v = a * dt
-        k4_h = (v + k3_v) * dt
+        k3_v = accel(v + 0.5 * dt * k2_v, h + 0.5 * dt * k2_h)
+        k3_h = v + 0.5 * dt * k2_v
+
+        k4_v = accel(v + dt * k3_v, h + dt * k3_h)
+        k4_h = v + dt * k3_v
         
-        v_new = v + (k1_v + 2*k2_v + 2*k3_v + k4_v) / 6
-        h_new = h + (k1_h + 2*k2_h + 2*k3_h + k4_h) / 6
+        v_new = v + dt * (k1_v + 2*k2_v + 2*k3_v + k4_v) / 6
+        h_new = h + dt * (k1_h + 2*k2_h + 2*k3_h + k4_h) / 6
         
         return v_new, h_new
 
@@ -276,30 +339,35 @@ class ThermalAnalysis:
             "carbon_fiber": {"thermal_conductivity": 8, "density": 1600, "specific_heat": 1000}
         }
     
-    def calculate_heat_transfer(self, velocity: float, altitude: float, 
+    def calculate_heat_transfer(self, velocity, altitude,
                               material: str = "aluminum", thickness: float = 0.01) -> Dict:
+        # Accepts scalars or arrays of samples; scalar inputs give scalar results.
+        v = np.asarray(velocity, dtype=float)
+        h = np.asarray(altitude, dtype=float)
 
         p0 = 1.225
         h0 = 8500
-        density = p0 * math.exp(-altitude / h0)
+        density = p0 * np.exp(-h / h0)
         
-        if velocity > 0:
-            h_conv = 0.026 * (velocity ** 0.8) * (density ** 0.2)
-            
-            q_conv = h_conv * (velocity ** 2) / 2
-            
-            q_rad = 5.67e-8 * 0.8 * (300 ** 4)
-            
-            total_heat = q_conv + q_rad
-        else:
-            total_heat = 0
+        moving = v > 0
+        v = np.where(moving, v, 0.0)
+        h_conv = 0.026 * (v ** 0.8) * (density ** 0.2)
+        
+        q_conv = h_conv * (v ** 2) / 2
+        
+        q_rad = np.where(moving, 5.67e-8 * 0.8 * (300 ** 4), 0.0)
+        
+        total_heat = q_conv + q_rad
         
         properties = self.material_properties.get(material, self.material_properties["aluminum"])
         temp_rise = total_heat * thickness / (properties["thermal_conductivity"] * properties["density"] * properties["specific_heat"])
         
+        if total_heat.ndim == 0:
+            q_conv, q_rad, total_heat, temp_rise = (float(q) for q in (q_conv, q_rad, total_heat, temp_rise))
+        
         return {
-            "convective_heat": q_conv if velocity > 0 else 0,
-            "radiative_heat": q_rad if velocity > 0 else 0,
+            "convective_heat": q_conv,
+            "radiative_heat": q_rad,
             "total_heat": total_heat,
             "temperature_rise": temp_rise,
             "material": material
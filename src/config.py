@@ -1,79 +1,154 @@
+import atexit
+import copy
+import functools
 import json
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import json_utils
+
+_DEFAULT_CONFIG = {
+    "theme": {
+        "primary_color": "#0D1B2A",
+        "secondary_color": "#1B263B", 
+        "accent_color": "#415A77",
+        "text_color": "#E0E1DD",
+        "success_color": "#4CAF50",
+        "warning_color": "#FF9800",
+        "error_color": "#F44336"
+    },
+    "simulation": {
+        "default_fuel_type": "RP1",
+        "default_chamber_pressure": 7000000,
+        "default_combustion_temp": 3500,
+        "default_initial_altitude": 0,
+        "default_total_mass": 10000,
+        "default_propellant_mass": 8000,
+        "default_mass_flow_rate": 250,
+        "default_time_step": 0.1,
+        "default_reference_area": 1.0,
+        "max_simulation_time": 300,
+        "real_time_interval": 0.25
+    },
+    "visualization": {
+        "animation_fps": 24,
+        "chart_style": "dark_background",
+        "enable_3d_plots": True,
+        "enable_real_time_metrics": True,
+        "auto_save_plots": True
+    },
+    "export": {
+        "default_format": "csv",
+        "auto_save_results": True,
+        "include_timestamp": True,
+        "compression_enabled": False
+    },
+    "logging": {
+        "level": "INFO",
+        "file_rotation": True,
+        "max_file_size": "10MB",
+        "backup_count": 5
+    },
+    "performance": {
+        "multiprocessing_enabled": True,
+        "cache_enabled": True,
+        "max_cache_size": 100
+    }
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_file(path: str, mtime: int) -> Dict[str, Any]:
+    # mtime is only part of the cache key, so a rewritten file misses the cache
+    return json_utils.load_file(path)
 
 class Config:
 
+    __slots__ = ("config_file", "default_config", "config", "_flat", "_dirty",
+                 "_lock", "_flush_timer", "_batch_depth")
+
+    # Seconds to wait after the last set() before writing the file
+    FLUSH_DELAY = 0.5
+
     def __init__(self, config_file: str = "flarepie_config.json"):
         self.config_file = config_file
-        self.default_config = {
-            "theme": {
-                "primary_color": "#0D1B2A",
-                "secondary_color": "#1B263B", 
-                "accent_color": "#415A77",
-                "text_color": "#E0E1DD",
-                "success_color": "#4CAF50",
-                "warning_color": "#FF9800",
-                "error_color": "#F44336"
-            },
-            "simulation": {
-                "default_fuel_type": "RP1",
-                "default_chamber_pressure": 7000000,
-                "default_combustion_temp": 3500,
-                "default_initial_altitude": 0,
-                "default_total_mass": 10000,
-                "default_propellant_mass": 8000,
-                "default_mass_flow_rate": 250,
-                "default_time_step": 0.1,
-                "default_reference_area": 1.0,
-                "max_simulation_time": 300,
-                "real_time_interval": 0.25
-            },
-            "visualization": {
-                "animation_fps": 24,
-                "chart_style": "dark_background",
-                "enable_3d_plots": True,
-                "enable_real_time_metrics": True,
-                "auto_save_plots": True
-            },
-            "export": {
-                "default_format": "csv",
-                "auto_save_results": True,
-                "include_timestamp": True,
-                "compression_enabled": False
-            },
-            "logging": {
-                "level": "INFO",
-                "file_rotation": True,
-                "max_file_size": "10MB",
-                "backup_count": 5
-            },
-            "performance": {
-                "multiprocessing_enabled": True,
-                "cache_enabled": True,
-                "max_cache_size": 100
-            }
-        }
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+        self.default_config = _DEFAULT_CONFIG
         self.config = self.load_config()
+        self._rebuild_flat()
+        atexit.register(self.flush)
     
     def load_config(self) -> Dict[str, Any]:
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return self.default_config
-        return self.default_config
+        # Both sources are shared, so hand out a private copy to mutate
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+            return copy.deepcopy(_load_config_file(self.config_file, mtime))
+        except (json.JSONDecodeError, FileNotFoundError):
+            return copy.deepcopy(_DEFAULT_CONFIG)
     
     def save_config(self):
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            with self._lock:
+                json_utils.atomic_write_json(self.config_file, self.config)
         except Exception as e:
             print(f"Error saving config: {e}")
     
+    def flush(self):
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+        self.save_config()
+    
+    @contextmanager
+    def batch(self):
+        """Group several set() calls into a single write when the block exits."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                done = self._batch_depth == 0
+            if done:
+                self.flush()
+    
+    def _mark_dirty(self):
+        with self._lock:
+            self._dirty = True
+            if self._batch_depth:
+                return
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _flatten(self, d: Dict[str, Any], prefix: str = ""):
+        for k, v in d.items():
+            path = f"{prefix}{k}"
+            if isinstance(v, dict):
+                yield from self._flatten(v, f"{path}.")
+            else:
+                yield path, v
+    
+    def _rebuild_flat(self):
+        # Leaf values keyed by dotted path, so get() is a single dict lookup
+        self._flat = dict(self._flatten(self.config))
+    
     def get(self, key: str, default: Any = None) -> Any:
+        if key in self._flat:
+            return self._flat[key]
+        # Keys naming a section (sub-dict) or absent keys take the slow walk
         keys = key.split('.')
         value = self.config
         for k in keys:
@@ -85,17 +160,21 @@ class Config:
     
     def set(self, key: str, value: Any):
         keys = key.split('.')
-        config = self.config
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        config[keys[-1]] = value
-        self.save_config()
+        with self._lock:
+            config = self.config
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            config[keys[-1]] = value
+            self._rebuild_flat()
+        self._mark_dirty()
     
     def reset_to_defaults(self):
-        self.config = self.default_config.copy()
-        self.save_config()
+        with self._lock:
+            self.config = copy.deepcopy(_DEFAULT_CONFIG)
+            self._rebuild_flat()
+        self._mark_dirty()
 
 # Global configuration instance
 config = Config() 
\ No newline at end of file
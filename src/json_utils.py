@@ -0,0 +1,77 @@
+import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Below this size a plain read beats the mmap setup cost
+MMAP_THRESHOLD = 256 * 1024
+
+
+def loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # Same layout as orjson: two-space indent, non-ASCII written as UTF-8
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def load_file_as(path: str, cls):
+    # msgspec decodes straight into the dataclass without an intermediate dict
+    if msgspec is not None:
+        with open(path, 'rb') as f:
+            try:
+                return msgspec.json.decode(f.read(), type=cls)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+    return cls(**load_file(path))
+
+
+def load_file(path: str):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return loads(view)
+
+
+def atomic_write_json(path: str, obj):
+    # Serialize up front so the file is written in one go, then swap it in
+    data = dumps(obj)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def dumps_line(obj) -> bytes:
+    # Compact single-line form for newline-delimited records
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, separators=(',', ':')).encode("utf-8") + b"\n"
+
+
+def append_line(path: str, obj) -> int:
+    data = dumps_line(obj)
+    with open(path, 'ab') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+        return os.fstat(f.fileno()).st_size
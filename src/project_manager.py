@@ -1,10 +1,15 @@
+import atexit
+import functools
 import json
 import os
+from operator import itemgetter
 import shutil
+import sys
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, replace
 import zipfile
+import json_utils
 
 @dataclass
 class SimulationConfig:
@@ -24,49 +29,155 @@ class SimulationConfig:
     tags: List[str]
     version: str = "1.0"
 
+# SimulationConfig is flat, so a shallow dict is enough for serialization
+# (tags is shared with the instance, not copied)
+_FIELDS = tuple(f.name for f in fields(SimulationConfig))
+
+def _id_timestamp(now: datetime) -> str:
+    # Same output as strftime('%Y%m%d_%H%M%S') without the format parser
+    return f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+
+_PROJ_FIELDS = ("name", "description", "created_date", "modified_date", "tags")
+_proj_getter = itemgetter(*_PROJ_FIELDS)
+
+def _project_summary(project_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    summary = {"id": project_id}
+    summary.update(zip(_PROJ_FIELDS, _proj_getter(data)))
+    summary["simulation_count"] = len(data["simulations"])
+    return summary
+
+def _iter_files(root: str, prefix: str = ""):
+    # scandir hands back file types from the directory read itself, so no extra stat per entry
+    with os.scandir(root) as it:
+        for entry in it:
+            arcname = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path, arcname + "/")
+            elif entry.is_file():
+                yield entry.path, arcname
+
+@functools.lru_cache(maxsize=128)
+def _load_config_file(path: str, mtime: int) -> SimulationConfig:
+    # mtime is only part of the cache key, so a rewritten file misses the cache
+    config = json_utils.load_file_as(path, SimulationConfig)
+    # Fuel types and tags come from a small vocabulary; share one str per value
+    config.fuel_type = sys.intern(config.fuel_type)
+    config.tags = [sys.intern(tag) for tag in config.tags]
+    return config
+
 class ProjectManager:
 
+    # Fold the journal back into projects.json once it grows past this size
+    JOURNAL_COMPACT_BYTES = 1024 * 1024
+
     def __init__(self, projects_dir: str = "projects"):
         self.projects_dir = projects_dir
         self.current_project: Optional[str] = None
         self.projects_file = os.path.join(projects_dir, "projects.json")
+        self.journal_file = os.path.join(projects_dir, "projects.log")
         self._ensure_directory()
+        self._projects_dirty = False
         self.projects = self._load_projects()
+        self._name_lower: Dict[str, str] = {}
+        self._desc_lower: Dict[str, str] = {}
+        self._tag_index: Dict[str, set] = {}
+        # Set view of each project's "simulations" list for O(1) membership checks
+        self._sim_names: Dict[str, set] = {}
+        for project_id in self.projects:
+            self._index_project(project_id)
+        atexit.register(self.flush)
     
     def _ensure_directory(self):
-        if not os.path.exists(self.projects_dir):
-            os.makedirs(self.projects_dir)
+        os.makedirs(self.projects_dir, exist_ok=True)
     
     def _load_projects(self) -> Dict[str, Any]:
-        if os.path.exists(self.projects_file):
+        try:
+            projects = json_utils.load_file(self.projects_file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            projects = {}
+        self._replay_journal(projects)
+        for data in projects.values():
+            data["tags"] = [sys.intern(tag) for tag in data["tags"]]
+        return projects
+    
+    def _replay_journal(self, projects: Dict[str, Any]):
+        try:
+            with open(self.journal_file, 'rb') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
             try:
-                with open(self.projects_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return {}
-        return {}
+                record = json_utils.loads(line)
+            except json.JSONDecodeError:
+                # A torn final record from a crash mid-append
+                break
+            if record["op"] == "put":
+                projects[record["id"]] = record["data"]
+            elif record["op"] == "delete":
+                projects.pop(record["id"], None)
+            self._projects_dirty = True
+    
+    def _append_journal(self, op: str, project_id: str):
+        record = {"op": op, "id": project_id}
+        if op == "put":
+            record["data"] = self.projects[project_id]
+        size = json_utils.append_line(self.journal_file, record)
+        self._projects_dirty = True
+        if size > self.JOURNAL_COMPACT_BYTES:
+            self.compact()
     
-    def _save_projects(self):
-        with open(self.projects_file, 'w') as f:
-            json.dump(self.projects, f, indent=4)
+    def compact(self):
+        json_utils.atomic_write_json(self.projects_file, self.projects)
+        # Replaying a stale journal over the new snapshot is harmless, so order is safe
+        try:
+            os.remove(self.journal_file)
+        except FileNotFoundError:
+            pass
+        self._projects_dirty = False
+    
+    def flush(self):
+        if self._projects_dirty:
+            self.compact()
+    
+    def _index_project(self, project_id: str):
+        data = self.projects[project_id]
+        self._name_lower[project_id] = data["name"].lower()
+        self._desc_lower[project_id] = data["description"].lower()
+        self._sim_names[project_id] = set(data["simulations"])
+        for tag in data["tags"]:
+            self._tag_index.setdefault(tag.lower(), set()).add(project_id)
+    
+    def _unindex_project(self, project_id: str):
+        self._name_lower.pop(project_id, None)
+        self._desc_lower.pop(project_id, None)
+        self._sim_names.pop(project_id, None)
+        for tag in self.projects[project_id]["tags"]:
+            pids = self._tag_index.get(tag.lower())
+            if pids is not None:
+                pids.discard(project_id)
+                if not pids:
+                    del self._tag_index[tag.lower()]
     
     def create_project(self, name: str, description: str = "", tags: Optional[List[str]] = None) -> str:
         if tags is None:
             tags = []
         
-        project_id = f"{name.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        created = now.isoformat()
+        project_id = f"{name.lower().replace(' ', '_')}_{_id_timestamp(now)}"
         project_dir = os.path.join(self.projects_dir, project_id)
         
-        if os.path.exists(project_dir):
-            raise ValueError(f"Project directory already exists: {project_id}")
-        
-        os.makedirs(project_dir)
+        try:
+            os.makedirs(project_dir)
+        except FileExistsError:
+            raise ValueError(f"Project directory already exists: {project_id}") from None
         
         default_config = SimulationConfig(
             name=name,
             description=description,
-            created_date=datetime.now().isoformat(),
-            modified_date=datetime.now().isoformat(),
+            created_date=created,
+            modified_date=created,
             fuel_type="RP1",
             chamber_pressure=7000000,
             combustion_temp=3500,
@@ -87,9 +198,9 @@ class ProjectManager:
             "tags": tags,
             "simulations": [default_config.name]
         }
+        self._index_project(project_id)
         
         self.save_simulation_config(project_id, default_config)
-        self._save_projects()
         
         return project_id
     
@@ -102,13 +213,14 @@ class ProjectManager:
         
         config.modified_date = datetime.now().isoformat()
         
-        with open(config_file, 'w') as f:
-            json.dump(asdict(config), f, indent=4)
+        json_utils.atomic_write_json(config_file, {k: getattr(config, k) for k in _FIELDS})
         
-        if config.name not in self.projects[project_id]["simulations"]:
+        names = self._sim_names[project_id]
+        if config.name not in names:
+            names.add(config.name)
             self.projects[project_id]["simulations"].append(config.name)
         self.projects[project_id]["modified_date"] = config.modified_date
-        self._save_projects()
+        self._append_journal("put", project_id)
         
         return True
     
@@ -119,45 +231,40 @@ class ProjectManager:
         project_dir = os.path.join(self.projects_dir, project_id)
         config_file = os.path.join(project_dir, f"{config_name.lower().replace(' ', '_')}.json")
         
-        if not os.path.exists(config_file):
+        try:
+            mtime = os.stat(config_file).st_mtime_ns
+        except FileNotFoundError:
             return None
         
         try:
-            with open(config_file, 'r') as f:
-                data = json.load(f)
-                return SimulationConfig(**data)
-        except (json.JSONDecodeError, KeyError):
+            config = _load_config_file(config_file, mtime)
+        except (ValueError, KeyError, TypeError):
             return None
+        # Hand out a copy so callers can't mutate the cached instance
+        return replace(config, tags=list(config.tags))
     
     def list_projects(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "id": project_id,
-                "name": data["name"],
-                "description": data["description"],
-                "created_date": data["created_date"],
-                "modified_date": data["modified_date"],
-                "tags": data["tags"],
-                "simulation_count": len(data["simulations"])
-            }
-            for project_id, data in self.projects.items()
-        ]
+        return [_project_summary(project_id, data) for project_id, data in self.projects.items()]
     
     def list_simulations(self, project_id: str) -> List[str]:
         if project_id not in self.projects:
             return []
-        return self.projects[project_id]["simulations"]
+        # A copy, so callers can't push names past the _sim_names index
+        return list(self.projects[project_id]["simulations"])
     
     def delete_project(self, project_id: str) -> bool:
         if project_id not in self.projects:
             return False
         
         project_dir = os.path.join(self.projects_dir, project_id)
-        if os.path.exists(project_dir):
+        try:
             shutil.rmtree(project_dir)
+        except FileNotFoundError:
+            pass
         
+        self._unindex_project(project_id)
         del self.projects[project_id]
-        self._save_projects()
+        self._append_journal("delete", project_id)
         return True
     
     def export_project(self, project_id: str, export_path: str) -> bool:
@@ -165,18 +272,17 @@ class ProjectManager:
             return False
         
         project_dir = os.path.join(self.projects_dir, project_id)
-        if not os.path.exists(project_dir):
+        try:
+            files = list(_iter_files(project_dir))
+        except FileNotFoundError:
             return False
         
         try:
             with zipfile.ZipFile(export_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(project_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, project_dir)
-                        zipf.write(file_path, arcname)
-            
-            zipf.writestr("project_info.json", json.dumps(self.projects[project_id], indent=4))
+                for file_path, arcname in files:
+                    zipf.write(file_path, arcname)
+                
+                zipf.writestr("project_info.json", json_utils.dumps(self.projects[project_id]))
             return True
         except Exception as e:
             print(f"Export error: {e}")
@@ -185,16 +291,34 @@ class ProjectManager:
     def import_project(self, import_path: str) -> Optional[str]:
         try:
             with zipfile.ZipFile(import_path, 'r') as zipf:
-                project_info = json.loads(zipf.read("project_info.json"))
+                project_info = json_utils.loads(zipf.read("project_info.json"))
                 
-                project_id = f"{project_info['name'].lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                now = datetime.now()
+                project_id = f"{project_info['name'].lower().replace(' ', '_')}_{_id_timestamp(now)}"
                 project_dir = os.path.join(self.projects_dir, project_id)
                 
-                zipf.extractall(project_dir)
+                members = [info for info in zipf.infolist() if info.filename != "project_info.json"]
+                # Reject "zip slip" entries before writing anything to disk
+                for info in members:
+                    parts = info.filename.replace("\\", "/").split("/")
+                    if os.path.isabs(info.filename) or ".." in parts or ":" in parts[0]:
+                        raise ValueError(f"Unsafe path in archive: {info.filename}")
                 
-                project_info["imported_date"] = datetime.now().isoformat()
+                # An archive may hold nothing but project_info.json
+                os.makedirs(project_dir, exist_ok=True)
+                for info in members:
+                    target = os.path.join(project_dir, info.filename)
+                    if info.is_dir():
+                        os.makedirs(target, exist_ok=True)
+                        continue
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    with zipf.open(info) as src, open(target, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+                
+                project_info["imported_date"] = now.isoformat()
                 self.projects[project_id] = project_info
-                self._save_projects()
+                self._index_project(project_id)
+                self._append_journal("put", project_id)
                 
                 return project_id
         except Exception as e:
@@ -205,18 +329,15 @@ class ProjectManager:
         query = query.lower()
         results = []
         
+        tag_hits = set()
+        for tag, pids in self._tag_index.items():
+            if query in tag:
+                tag_hits |= pids
+        
         for project_id, data in self.projects.items():
-            if (query in data["name"].lower() or 
-                query in data["description"].lower() or 
-                any(query in tag.lower() for tag in data["tags"])):
-                results.append({
-                    "id": project_id,
-                    "name": data["name"],
-                    "description": data["description"],
-                    "created_date": data["created_date"],
-                    "modified_date": data["modified_date"],
-                    "tags": data["tags"],
-                    "simulation_count": len(data["simulations"])
-                })
+            if (project_id in tag_hits or
+                query in self._name_lower[project_id] or 
+                query in self._desc_lower[project_id]):
+                results.append(_project_summary(project_id, data))
         
         return results 
\ No newline at end of file
@@ -1,28 +1,135 @@
-import json
 import os
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.backends.backend_pdf import PdfPages
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 import numpy as np
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-import io
-import base64
-from Engine import get_atmospheric_pressure
+import functools
+
+# matplotlib and reportlab are imported where they are used, so importing this
+# module (and starting the app) doesn't pay for them until a report is generated
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from reportlab.platypus import TableStyle
+
+# np.trapz was renamed to np.trapezoid in NumPy 2.0 and later removed
+_trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+
+# Upper bound on points per chart series; longer series are evenly subsampled
+MAX_CHART_POINTS = 4000
+
+# Charts are embedded at 6x4 inches, so render them at that size directly
+CHART_SIZE = (6, 4)
+CHART_DPI = 150
+
+# Atmosphere and heating model constants, with the divisors stored as inverses
+_RHO0 = 1.225                    # Sea-level density (kg/m³)
+_INV_SCALE_H = 1.0 / 8500.0      # Density scale height (1/m)
+_LAPSE_OVER_T0 = 0.0065 / 288.15  # Temperature lapse rate over sea-level temperature (1/m)
+_INV_MU0 = 1.0 / 1.8e-5          # Sea-level dynamic viscosity (1/(Pa·s))
+_HEAT_FLUX_K = 0.026
+
+_HEAT_FLUX_COEFF = _HEAT_FLUX_K / 2 * _RHO0**0.2
+
+def _memoize(fn):
+    # Metrics are pure functions of the dataset, so remember them for the dict last seen
+    name = fn.__name__
+    
+    @functools.wraps(fn)
+    def wrapper(self, simulation_data):
+        cache = self._metric_cache
+        if cache is None or cache[0] is not simulation_data:
+            cache = self._metric_cache = (simulation_data, {})
+        values = cache[1]
+        if name not in values:
+            values[name] = fn(self, simulation_data)
+        return values[name]
+    return wrapper
+
+def _aero_kernel(v: np.ndarray, h: np.ndarray, drag: np.ndarray):
+    # In-place ufunc chains keep the fused pass down to a handful of buffers
+    density = np.multiply(h, -_INV_SCALE_H)
+    np.exp(density, out=density)
+    density *= _RHO0  # Simplified atmospheric density
+    
+    q = density * v
+    q *= v
+    q *= 0.5
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # density * v / (1.8e-5 * sqrt(288.15 / T)) with T = 288.15 - 0.0065 * h
+        reynolds = np.multiply(h, -_LAPSE_OVER_T0)
+        reynolds += 1.0
+        np.sqrt(reynolds, out=reynolds)
+        reynolds *= density
+        reynolds *= v
+        reynolds *= _INV_MU0
+        
+        # 0.026 * v**0.8 * density**0.2 * v**2 / 2, with both fractional powers folded
+        # into one exp since density**0.2 = 1.225**0.2 * exp(-0.2 * h / 8500)
+        heat_flux = np.log(v)
+        heat_flux *= 0.8
+        heat_flux -= h * (0.2 * _INV_SCALE_H)
+        np.exp(heat_flux, out=heat_flux)
+        heat_flux *= v
+        heat_flux *= v
+        heat_flux *= _HEAT_FLUX_COEFF
+        
+        cd = drag / q[:drag.size]  # Assuming reference area of 1.0
+    
+    return density, q, reynolds, heat_flux, cd
+
 
 class ReportGenerator:
 
+    # Built on first use and shared by every generator
+    _stylesheet = None
+    _table_styles: Optional[Dict[str, 'TableStyle']] = None
+
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self._aero_cache = None
+        self._np_cache = None
+        self._chart_figures: Dict[str, 'Figure'] = {}
+        self._metric_cache = None
+    
+    @property
+    def styles(self):
+        if ReportGenerator._stylesheet is None:
+            from reportlab.lib.styles import getSampleStyleSheet
+            ReportGenerator._stylesheet = getSampleStyleSheet()
+            self._setup_custom_styles()
+        return ReportGenerator._stylesheet
+    
+    @classmethod
+    def _get_table_styles(cls) -> Dict[str, 'TableStyle']:
+        if cls._table_styles is None:
+            from reportlab.platypus import TableStyle
+            from reportlab.lib import colors
+            cls._table_styles = {
+                'title': TableStyle([
+                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+                    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+                    ('FONTSIZE', (0, 0), (-1, -1), 10),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ]),
+                'params': TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, 0), 12),
+                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ])
+            }
+        return cls._table_styles
     
     def _setup_custom_styles(self):
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+        
         if 'Title' not in self.styles:
             self.styles.add(ParagraphStyle(
                 name='Title',
@@ -62,8 +169,12 @@ class ReportGenerator:
     
     def generate_simulation_report(self, simulation_data: Dict, config: Dict, 
                                  output_path: str = None) -> str:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate
+        
+        now = datetime.now()
         if output_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             output_path = f"simulation_report_{timestamp}.pdf"
         
         doc = SimpleDocTemplate(output_path, pagesize=A4, rightMargin=72, leftMargin=72, 
@@ -71,26 +182,35 @@ class ReportGenerator:
         
         story = []
         
-        story.extend(self._create_title_page(simulation_data, config))
+        # Convert the numeric series to arrays once; every metric and chart reads from that cache
+        self._get_arrays(simulation_data)
+        
+        # Sections quote the same peaks and averages, so reduce each array once up front
+        m = self._precompute_metrics(simulation_data, now)
         
-        story.extend(self._create_executive_summary(simulation_data))
+        story.extend(self._create_title_page(simulation_data, config, m))
+        
+        story.extend(self._create_executive_summary(simulation_data, m))
         
         story.extend(self._create_mission_parameters(config))
         
-        story.extend(self._create_performance_analysis(simulation_data))
+        story.extend(self._create_performance_analysis(simulation_data, m))
         
-        story.extend(self._create_trajectory_analysis(simulation_data))
+        story.extend(self._create_trajectory_analysis(simulation_data, m))
         
-        story.extend(self._create_technical_details(simulation_data))
+        story.extend(self._create_technical_details(simulation_data, m))
         
         story.extend(self._create_charts_section(simulation_data))
         
-        story.extend(self._create_recommendations(simulation_data))
+        story.extend(self._create_recommendations(simulation_data, m))
         
         doc.build(story)
         return output_path
     
-    def _create_title_page(self, simulation_data: Dict, config: Dict) -> List:
+    def _create_title_page(self, simulation_data: Dict, config: Dict, m: Dict[str, Any]) -> List:
+        from reportlab.platypus import Paragraph, Spacer, Table
+        from reportlab.lib.units import inch
+        
         elements = []
         
         title = Paragraph("ROCKET SIMULATION REPORT", self.styles['Title'])
@@ -102,29 +222,24 @@ class ReportGenerator:
         elements.append(Spacer(1, 100))
         
         details_data = [
-            ["Report Generated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-            ["Simulation Duration:", f"{simulation_data.get('final_time', 0):.2f} seconds"],
-            ["Maximum Altitude:", f"{max(simulation_data.get('altitude', [0])):.2f} meters"],
-            ["Maximum Velocity:", f"{max(simulation_data.get('velocity', [0])):.2f} m/s"],
+            ["Report Generated:", m['generated_at']],
+            ["Simulation Duration:", f"{m['final_time_str']} seconds"],
+            ["Maximum Altitude:", f"{m['max_alt_str']} meters"],
+            ["Maximum Velocity:", f"{m['max_vel_str']} m/s"],
             ["Fuel Type:", config.get('fuel_type', 'Unknown')],
             ["Total Mass:", f"{config.get('intmass', 0):.2f} kg"]
         ]
         
         details_table = Table(details_data, colWidths=[2*inch, 3*inch])
-        details_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        details_table.setStyle(self._get_table_styles()['title'])
         elements.append(details_table)
         elements.append(Spacer(1, 50))
         
         return elements
     
-    def _create_executive_summary(self, simulation_data: Dict) -> List:
+    def _create_executive_summary(self, simulation_data: Dict, m: Dict[str, Any]) -> List:
+        from reportlab.platypus import Paragraph, Spacer
+        
         elements = []
         
         # Section title
@@ -133,22 +248,22 @@ class ReportGenerator:
         elements.append(Spacer(1, 20))
         
         # Key metrics
-        max_altitude = max(simulation_data.get('altitude', [0]))
-        max_velocity = max(simulation_data.get('velocity', [0]))
-        final_time = simulation_data.get('final_time', 0)
-        delta_v = simulation_data.get('delta_v', 0)
+        max_altitude = m['max_alt_str']
+        max_velocity = m['max_vel_str']
+        final_time = m['final_time_str']
+        delta_v = m['delta_v_str']
         
         summary_text = f"""
-        This simulation analyzed the performance of a rocket propulsion system over {final_time:.2f} seconds. 
-        The mission achieved a maximum altitude of {max_altitude:.2f} meters and a peak velocity of {max_velocity:.2f} m/s, 
-        with a total delta-V of {delta_v:.2f} m/s.
+        This simulation analyzed the performance of a rocket propulsion system over {final_time} seconds. 
+        The mission achieved a maximum altitude of {max_altitude} meters and a peak velocity of {max_velocity} m/s, 
+        with a total delta-V of {delta_v} m/s.
         
         Key findings include:
-        • Mission duration: {final_time:.2f} seconds
-        • Maximum altitude: {max_altitude:.2f} meters
-        • Peak velocity: {max_velocity:.2f} m/s
-        • Total delta-V: {delta_v:.2f} m/s
-        • Propellant efficiency: {self._calculate_efficiency(simulation_data):.2f}%
+        • Mission duration: {final_time} seconds
+        • Maximum altitude: {max_altitude} meters
+        • Peak velocity: {max_velocity} m/s
+        • Total delta-V: {delta_v} m/s
+        • Propellant efficiency: {m['efficiency_str']}%
         """
         
         summary = Paragraph(summary_text, self.styles['Body'])
@@ -158,6 +273,9 @@ class ReportGenerator:
         return elements
     
     def _create_mission_parameters(self, config: Dict) -> List:
+        from reportlab.platypus import Paragraph, Spacer, Table
+        from reportlab.lib.units import inch
+        
         elements = []
         
         title = Paragraph("MISSION PARAMETERS", self.styles['Section'])
@@ -178,31 +296,23 @@ class ReportGenerator:
         ]
         
         params_table = Table(params_data, colWidths=[2*inch, 2*inch, 1*inch])
-        params_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        params_table.setStyle(self._get_table_styles()['params'])
         elements.append(params_table)
         elements.append(Spacer(1, 30))
         
         return elements
     
-    def _create_performance_analysis(self, simulation_data: Dict) -> List:
+    def _create_performance_analysis(self, simulation_data: Dict, m: Dict[str, Any]) -> List:
+        from reportlab.platypus import Paragraph, Spacer
+        
         elements = []
         
         title = Paragraph("PERFORMANCE ANALYSIS", self.styles['Section'])
         elements.append(title)
         elements.append(Spacer(1, 20))
         
-        max_thrust = max(simulation_data.get('thrust', [0]))
-        avg_isp = np.mean(simulation_data.get('isp_values', [0]))
-        efficiency = self._calculate_efficiency(simulation_data)
+        max_thrust = m['max_thrust']
+        avg_isp = m['avg_isp']
         
         performance_text = f"""
         Performance Analysis Results:
@@ -210,17 +320,17 @@ class ReportGenerator:
         Thrust Performance:
         • Maximum thrust: {max_thrust:.2f} N
         • Average specific impulse: {avg_isp:.2f} s
-        • Propellant efficiency: {efficiency:.2f}%
+        • Propellant efficiency: {m['efficiency_str']}%
         
         Trajectory Performance:
-        • Maximum altitude: {max(simulation_data.get('altitude', [0])):.2f} m
-        • Peak velocity: {max(simulation_data.get('velocity', [0])):.2f} m/s
-        • Total delta-V: {simulation_data.get('delta_v', 0):.2f} m/s
+        • Maximum altitude: {m['max_alt_str']} m
+        • Peak velocity: {m['max_vel_str']} m/s
+        • Total delta-V: {m['delta_v_str']} m/s
         
         Mission Efficiency:
-        • Thrust-to-weight ratio range: {self._calculate_twr_range(simulation_data):.2f}
-        • Average acceleration: {self._calculate_avg_acceleration(simulation_data):.2f} m/s²
-        • Mission success probability: {self._calculate_success_probability(simulation_data):.1f}%
+        • Thrust-to-weight ratio range: {m['twr_range']:.2f}
+        • Average acceleration: {m['avg_acc']:.2f} m/s²
+        • Mission success probability: {m['success_probability']:.1f}%
         """
         
         performance = Paragraph(performance_text, self.styles['Body'])
@@ -229,24 +339,26 @@ class ReportGenerator:
         
         return elements
     
-    def _create_trajectory_analysis(self, simulation_data: Dict) -> List:
+    def _create_trajectory_analysis(self, simulation_data: Dict, m: Dict[str, Any]) -> List:
+        from reportlab.platypus import Paragraph, Spacer
+        
         elements = []
         
         title = Paragraph("TRAJECTORY ANALYSIS", self.styles['Section'])
         elements.append(title)
         elements.append(Spacer(1, 20))
         
-        altitudes = simulation_data.get('altitude', [])
-        velocities = simulation_data.get('velocity', [])
-        times = simulation_data.get('time', [])
+        arrays = self._get_arrays(simulation_data)
+        altitudes = arrays['altitude']
+        velocities = arrays['velocity']
+        times = arrays['time']
         
-        if altitudes and velocities and times:
-            max_altitude = max(altitudes)
-            max_velocity = max(velocities)
-            burn_time = times[-1] if times else 0
+        if altitudes.size and velocities.size and times.size:
+            max_altitude = m['max_alt']
+            burn_time = float(times[-1])
             
-            max_altitude_time = times[altitudes.index(max_altitude)]
-            max_velocity_time = times[velocities.index(max_velocity)]
+            max_altitude_time = float(times[m['idx_max_alt']])
+            max_velocity_time = float(times[m['idx_max_vel']])
             
             trajectory_text = f"""
             Trajectory Characteristics:
@@ -257,14 +369,14 @@ class ReportGenerator:
             • Time to max velocity: {max_velocity_time:.2f} seconds
             
             Trajectory Analysis:
-            • Maximum altitude: {max_altitude:.2f} meters
-            • Peak velocity: {max_velocity:.2f} m/s
+            • Maximum altitude: {m['max_alt_str']} meters
+            • Peak velocity: {m['max_vel_str']} m/s
             • Average climb rate: {max_altitude/max_altitude_time if max_altitude_time > 0 else 0:.2f} m/s
             
             Atmospheric Effects:
-            • Maximum dynamic pressure: {self._calculate_max_q(simulation_data):.2f} Pa
-            • Maximum Mach number: {self._calculate_max_mach(simulation_data):.2f}
-            • Maximum drag force: {max(simulation_data.get('drag', [0])):.2f} N
+            • Maximum dynamic pressure: {m['max_q']:.2f} Pa
+            • Maximum Mach number: {m['max_mach']:.2f}
+            • Maximum drag force: {m['max_drag']:.2f} N
             """
             
             trajectory = Paragraph(trajectory_text, self.styles['Body'])
@@ -273,25 +385,31 @@ class ReportGenerator:
         elements.append(Spacer(1, 30))
         return elements
     
-    def _create_technical_details(self, simulation_data: Dict) -> List:
+    def _create_technical_details(self, simulation_data: Dict, m: Dict[str, Any]) -> List:
         """Create technical details section"""
+        from reportlab.platypus import Paragraph, Spacer
+        
         elements = []
         
         title = Paragraph("TECHNICAL DETAILS", self.styles['Section'])
         elements.append(title)
         elements.append(Spacer(1, 20))
         
+        # A rocket that never leaves the pad has no velocity to normalise drag by
+        max_vel = m['max_vel'] if 'velocity' in simulation_data else 1.0
+        avg_cd = m['avg_drag'] / max_vel**2 if max_vel else 0.0
+        
         technical_text = f"""
         Technical Analysis:
         
         Propulsion System:
         • Total impulse: {self._calculate_total_impulse(simulation_data):.2f} N·s
-        • Average thrust: {np.mean(simulation_data.get('thrust', [0])):.2f} N
+        • Average thrust: {m['avg_thrust']:.2f} N
         • Thrust coefficient: {self._calculate_thrust_coefficient(simulation_data):.3f}
         
         Aerodynamics:
         • Maximum drag coefficient: {self._calculate_max_cd(simulation_data):.3f}
-        • Average drag coefficient: {np.mean(simulation_data.get('drag', [0]))/max(simulation_data.get('velocity', [1]))**2:.3f}
+        • Average drag coefficient: {avg_cd:.3f}
         • Reynolds number range: {self._calculate_reynolds_range(simulation_data):.0f}
         
         Thermal Analysis:
@@ -307,6 +425,9 @@ class ReportGenerator:
         return elements
     
     def _create_charts_section(self, simulation_data: Dict) -> List:
+        from reportlab.platypus import Paragraph, Spacer, Image
+        from reportlab.lib.units import inch
+        
         elements = []
         
         title = Paragraph("CHARTS AND GRAPHS", self.styles['Section'])
@@ -324,35 +445,75 @@ class ReportGenerator:
         
         return elements
     
-    def _create_recommendations(self, simulation_data: Dict) -> List:
+    def _create_recommendations(self, simulation_data: Dict, m: Dict[str, Any]) -> List:
+        from reportlab.platypus import Paragraph, Spacer
+        
         elements = []
         
         title = Paragraph("RECOMMENDATIONS", self.styles['Section'])
         elements.append(title)
         elements.append(Spacer(1, 20))
         
-        recommendations = self._generate_recommendations(simulation_data)
+        recommendations = self._generate_recommendations(simulation_data, m)
         
-        for rec in recommendations:
-            rec_para = Paragraph(f"• {rec}", self.styles['Body'])
-            elements.append(rec_para)
-            elements.append(Spacer(1, 10))
+        # One flowable for the whole list instead of a Paragraph and Spacer per item
+        rec_para = Paragraph("<br/>".join(f"• {rec}" for rec in recommendations), self.styles['Body'])
+        elements.append(rec_para)
         
         elements.append(Spacer(1, 30))
         return elements
     
     def _generate_charts(self, simulation_data: Dict) -> List[str]:
-        charts = []
+        import matplotlib.style
+        
+        arrays = self._get_arrays(simulation_data)
+        times = arrays['time']
+        
+        # Long runs carry far more points than a 6-inch chart can show
+        idx = None
+        if times.size > MAX_CHART_POINTS:
+            idx = np.linspace(0, times.size - 1, MAX_CHART_POINTS).astype(int)
+        
+        def sample(key: str) -> np.ndarray:
+            values = arrays[key]
+            return values if idx is None else values[idx[idx < values.size]]
         
-        plt.style.use('dark_background')
+        series = {key: sample(key) for key in ('time', 'altitude', 'velocity', 'thrust', 'isp_values', 'fuel_remaining')}
         
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+        with matplotlib.style.context('dark_background'):
+            figures = [
+                (self._draw_trajectory_fig(series), "trajectory_chart.png"),
+                (self._draw_performance_fig(series, simulation_data), "performance_chart.png")
+            ]
+        
+        # Rendered one after the other: matplotlib's font and text caches are not thread-safe
+        for fig, chart_path in figures:
+            fig.savefig(chart_path, dpi=CHART_DPI, facecolor=fig.get_facecolor())
+        return [chart_path for _, chart_path in figures]
+    
+    def _chart_figure(self, name: str) -> 'Figure':
+        # Figures are reused across reports; only their axes are rebuilt
+        fig = self._chart_figures.get(name)
+        if fig is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            
+            fig = Figure(figsize=CHART_SIZE)
+            FigureCanvasAgg(fig)
+            self._chart_figures[name] = fig
+        else:
+            fig.clear()
+        return fig
+    
+    def _draw_trajectory_fig(self, series: Dict[str, np.ndarray]) -> 'Figure':
+        fig = self._chart_figure('trajectory')
+        ax1, ax2 = fig.subplots(2, 1)
         
-        times = simulation_data.get('time', [])
-        altitudes = simulation_data.get('altitude', [])
-        velocities = simulation_data.get('velocity', [])
+        times = series['time']
+        altitudes = series['altitude']
+        velocities = series['velocity']
         
-        if times and altitudes and velocities:
+        if times.size and altitudes.size and velocities.size:
             ax1.plot(times, altitudes, 'b-', linewidth=2, label='Altitude')
             ax1.set_ylabel('Altitude (m)')
             ax1.set_title('Flight Trajectory')
@@ -365,31 +526,31 @@ class ReportGenerator:
             ax2.grid(True, alpha=0.3)
             ax2.legend()
         
-        plt.tight_layout()
-        chart_path = "trajectory_chart.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        charts.append(chart_path)
-        plt.close()
-        
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
+        fig.tight_layout()
+        return fig
+    
+    def _draw_performance_fig(self, series: Dict[str, np.ndarray], simulation_data: Dict) -> 'Figure':
+        fig = self._chart_figure('performance')
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
-        thrusts = simulation_data.get('thrust', [])
-        isp_values = simulation_data.get('isp_values', [])
-        fuel_remaining = simulation_data.get('fuel_remaining', [])
+        times = series['time']
+        thrusts = series['thrust']
+        isp_values = series['isp_values']
+        fuel_remaining = series['fuel_remaining']
         
-        if times and thrusts:
+        if times.size and thrusts.size:
             ax1.plot(times, thrusts, 'g-', linewidth=2)
             ax1.set_ylabel('Thrust (N)')
             ax1.set_title('Thrust Profile')
             ax1.grid(True, alpha=0.3)
         
-        if times and isp_values:
+        if times.size and isp_values.size:
             ax2.plot(times, isp_values, 'y-', linewidth=2)
             ax2.set_ylabel('Specific Impulse (s)')
             ax2.set_title('ISP Profile')
             ax2.grid(True, alpha=0.3)
         
-        if times and fuel_remaining:
+        if times.size and fuel_remaining.size:
             ax3.plot(times, fuel_remaining, 'm-', linewidth=2)
             ax3.set_xlabel('Time (s)')
             ax3.set_ylabel('Fuel Remaining (kg)')
@@ -397,35 +558,24 @@ class ReportGenerator:
             ax3.grid(True, alpha=0.3)
         
         # TWR plot
-        if times and thrusts and fuel_remaining:
-            twr_values = []
-            for i, thrust in enumerate(thrusts):
-                if i < len(fuel_remaining):
-                    mass = simulation_data.get('intmass', 0) - simulation_data.get('propmass', 0) + fuel_remaining[i]
-                    weight = mass * 9.81
-                    twr = thrust / weight if weight > 0 else 0
-                    twr_values.append(twr)
+        if times.size and thrusts.size and fuel_remaining.size:
+            twr_values = self._twr_values(simulation_data, thrusts, fuel_remaining)
             
-            ax4.plot(times[:len(twr_values)], twr_values, 'c-', linewidth=2)
+            ax4.plot(times[:twr_values.size], twr_values, 'c-', linewidth=2)
             ax4.set_xlabel('Time (s)')
             ax4.set_ylabel('Thrust/Weight Ratio')
             ax4.set_title('TWR Profile')
             ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        chart_path = "performance_chart.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        charts.append(chart_path)
-        plt.close()
-        
-        return charts
+        fig.tight_layout()
+        return fig
     
-    def _generate_recommendations(self, simulation_data: Dict) -> List[str]:
+    def _generate_recommendations(self, simulation_data: Dict, m: Dict[str, Any]) -> List[str]:
         recommendations = []
         
-        max_altitude = max(simulation_data.get('altitude', [0]))
-        max_velocity = max(simulation_data.get('velocity', [0]))
-        efficiency = self._calculate_efficiency(simulation_data)
+        max_altitude = m['max_alt']
+        max_velocity = m['max_vel']
+        efficiency = m['efficiency']
         
         if efficiency < 80:
             recommendations.append("Consider optimizing propellant mixture ratio for better efficiency")
@@ -436,7 +586,7 @@ class ReportGenerator:
         if max_velocity < 1000:
             recommendations.append("Consider higher thrust or longer burn time for increased velocity")
         
-        twr_range = self._calculate_twr_range(simulation_data)
+        twr_range = m['twr_range']
         if twr_range < 1.5:
             recommendations.append("Increase thrust-to-weight ratio for better performance")
         
@@ -446,55 +596,115 @@ class ReportGenerator:
         
         return recommendations
     
+    def _precompute_metrics(self, simulation_data: Dict, now: Optional[datetime] = None) -> Dict[str, Any]:
+        arrays = self._get_arrays(simulation_data)
+        
+        def peak(key: str) -> float:
+            values = arrays[key]
+            return float(values.max()) if values.size else 0.0
+        
+        def mean(key: str) -> float:
+            values = arrays[key]
+            return float(values.mean()) if values.size else 0.0
+        
+        # Index of the first sample at each peak, so later sections can look up when it happened
+        altitudes, velocities = arrays['altitude'], arrays['velocity']
+        idx_max_alt = int(altitudes.argmax()) if altitudes.size else None
+        idx_max_vel = int(velocities.argmax()) if velocities.size else None
+        
+        metrics = {
+            'idx_max_alt': idx_max_alt,
+            'idx_max_vel': idx_max_vel,
+            'max_alt': float(altitudes[idx_max_alt]) if idx_max_alt is not None else 0.0,
+            'max_vel': float(velocities[idx_max_vel]) if idx_max_vel is not None else 0.0,
+            'max_thrust': peak('thrust'),
+            'max_drag': peak('drag'),
+            'avg_thrust': mean('thrust'),
+            'avg_isp': mean('isp_values'),
+            'avg_drag': mean('drag'),
+            'efficiency': self._calculate_efficiency(simulation_data),
+            'twr_range': self._calculate_twr_range(simulation_data),
+            'avg_acc': self._calculate_avg_acceleration(simulation_data),
+            'success_probability': self._calculate_success_probability(simulation_data),
+            'max_q': self._calculate_max_q(simulation_data),
+            'max_mach': self._calculate_max_mach(simulation_data)
+        }
+        # Values quoted in several sections are formatted once
+        for key in ('max_alt', 'max_vel', 'efficiency'):
+            metrics[f'{key}_str'] = f"{metrics[key]:.2f}"
+        metrics['final_time_str'] = f"{simulation_data.get('final_time', 0):.2f}"
+        metrics['delta_v_str'] = f"{simulation_data.get('delta_v', 0):.2f}"
+        metrics['generated_at'] = (now or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+        return metrics
+    
+    def _get_arrays(self, simulation_data: Dict) -> Dict[str, np.ndarray]:
+        if self._np_cache is not None and self._np_cache[0] is simulation_data:
+            return self._np_cache[1]
+        
+        arrays = {
+            key: np.asarray(simulation_data.get(key, []), dtype=np.float64)
+            for key in ('time', 'altitude', 'velocity', 'thrust', 'drag', 'isp_values', 'fuel_remaining')
+        }
+        self._np_cache = (simulation_data, arrays)
+        return arrays
+    
+    def _peak(self, simulation_data: Dict, key: str) -> float:
+        values = self._get_arrays(simulation_data)[key]
+        return float(values.max()) if values.size else 0.0
+    
+    @_memoize
     def _calculate_efficiency(self, simulation_data: Dict) -> float:
-        fuel_remaining = simulation_data.get('fuel_remaining', [])
-        if not fuel_remaining:
+        fuel_remaining = self._get_arrays(simulation_data)['fuel_remaining']
+        if not fuel_remaining.size:
             return 0.0
         
-        initial_fuel = fuel_remaining[0]
-        final_fuel = fuel_remaining[-1]
+        initial_fuel = float(fuel_remaining[0])
+        final_fuel = float(fuel_remaining[-1])
         if initial_fuel > 0:
             return ((initial_fuel - final_fuel) / initial_fuel) * 100
         return 0.0
     
+    def _twr_values(self, simulation_data: Dict, thrusts: np.ndarray, fuel_remaining: np.ndarray) -> np.ndarray:
+        # Dry mass is constant over the flight, so look it up once
+        dry_mass = simulation_data.get('intmass', 0) - simulation_data.get('propmass', 0)
+        n = min(thrusts.size, fuel_remaining.size)
+        weight = (dry_mass + fuel_remaining[:n]) * 9.81
+        thrust = thrusts[:n]
+        return np.divide(thrust, weight, out=np.zeros(n), where=weight > 0)
+    
+    @_memoize
     def _calculate_twr_range(self, simulation_data: Dict) -> float:
-        thrusts = simulation_data.get('thrust', [])
-        fuel_remaining = simulation_data.get('fuel_remaining', [])
+        arrays = self._get_arrays(simulation_data)
+        thrusts = arrays['thrust']
+        fuel_remaining = arrays['fuel_remaining']
         
-        if not thrusts or not fuel_remaining:
+        if not thrusts.size or not fuel_remaining.size:
             return 0.0
         
-        twr_values = []
-        for i, thrust in enumerate(thrusts):
-            if i < len(fuel_remaining):
-                mass = simulation_data.get('intmass', 0) - simulation_data.get('propmass', 0) + fuel_remaining[i]
-                weight = mass * 9.81
-                twr = thrust / weight if weight > 0 else 0
-                twr_values.append(twr)
-        
-        return max(twr_values) - min(twr_values) if twr_values else 0.0
+        twr_values = self._twr_values(simulation_data, thrusts, fuel_remaining)
+        return float(twr_values.max() - twr_values.min())
     
+    @_memoize
     def _calculate_avg_acceleration(self, simulation_data: Dict) -> float:
-        velocities = simulation_data.get('velocity', [])
-        times = simulation_data.get('time', [])
+        arrays = self._get_arrays(simulation_data)
+        velocities = arrays['velocity']
+        times = arrays['time']
         
-        if len(velocities) < 2 or len(times) < 2:
+        if velocities.size < 2 or times.size < 2:
             return 0.0
         
-        total_acc = 0
-        count = 0
-        for i in range(1, len(velocities)):
-            dt = times[i] - times[i-1]
-            if dt > 0:
-                acc = (velocities[i] - velocities[i-1]) / dt
-                total_acc += acc
-                count += 1
-        
-        return total_acc / count if count > 0 else 0.0
+        n = min(velocities.size, times.size)
+        dv = np.diff(velocities[:n])
+        dt = np.diff(times[:n])
+        forward = dt > 0
+        if not forward.any():
+            return 0.0
+        return float((dv[forward] / dt[forward]).mean())
     
+    @_memoize
     def _calculate_success_probability(self, simulation_data: Dict) -> float:
-        max_altitude = max(simulation_data.get('altitude', [0]))
-        max_velocity = max(simulation_data.get('velocity', [0]))
+        max_altitude = self._peak(simulation_data, 'altitude')
+        max_velocity = self._peak(simulation_data, 'velocity')
         efficiency = self._calculate_efficiency(simulation_data)
         
         # Scoring system
@@ -504,129 +714,136 @@ class ReportGenerator:
         
         return altitude_score + velocity_score + efficiency_score
     
+    @_memoize
     def _calculate_max_q(self, simulation_data: Dict) -> float:
-        velocities = simulation_data.get('velocity', [])
-        altitudes = simulation_data.get('altitude', [])
+        arrays = self._get_arrays(simulation_data)
+        velocities = arrays['velocity']
+        altitudes = arrays['altitude']
         
-        if not velocities or not altitudes:
+        if not velocities.size or not altitudes.size:
             return 0.0
         
-        max_q = 0
-        for v, h in zip(velocities, altitudes):
-            # Simplified atmospheric density
-            density = 1.225 * np.exp(-h / 8500)
-            q = 0.5 * density * v**2
-            max_q = max(max_q, q)
-        
-        return max_q
+        q = self._compute_aero_arrays(simulation_data)['q']
+        return float(max(q.max(), 0.0))
     
+    @_memoize
     def _calculate_max_mach(self, simulation_data: Dict) -> float:
-        velocities = simulation_data.get('velocity', [])
-        altitudes = simulation_data.get('altitude', [])
+        arrays = self._get_arrays(simulation_data)
+        velocities = arrays['velocity']
+        altitudes = arrays['altitude']
         
-        if not velocities or not altitudes:
+        if not velocities.size or not altitudes.size:
             return 0.0
         
-        max_mach = 0
-        for v, h in zip(velocities, altitudes):
-            # Speed of sound at altitude
-            speed_of_sound = 340 * np.sqrt(get_atmospheric_pressure(h) / 101325)
-            mach = v / speed_of_sound if speed_of_sound > 0 else 0
-            max_mach = max(max_mach, mach)
-        
-        return max_mach
+        n = min(velocities.size, altitudes.size)
+        v = velocities[:n]
+        h = altitudes[:n]
+        # Speed of sound at altitude; the pressure ratio is get_atmospheric_pressure inlined
+        base = np.maximum(1.0 - 2.25577e-5 * np.maximum(h, 0.0), 0.0)
+        speed_of_sound = 340.0 * np.sqrt(base ** 5.25588)
+        mach = np.divide(v, speed_of_sound, out=np.zeros_like(v), where=speed_of_sound > 0)
+        return float(max(mach.max(), 0.0))
     
+    @_memoize
     def _calculate_total_impulse(self, simulation_data: Dict) -> float:
-        thrusts = simulation_data.get('thrust', [])
-        times = simulation_data.get('time', [])
+        arrays = self._get_arrays(simulation_data)
+        thrusts = arrays['thrust']
+        times = arrays['time']
         
-        if not thrusts or not times:
+        n = min(thrusts.size, times.size)
+        if n < 2:
             return 0.0
-        
-        total_impulse = 0
-        for i in range(1, len(thrusts)):
-            dt = times[i] - times[i-1]
-            avg_thrust = (thrusts[i] + thrusts[i-1]) / 2
-            total_impulse += avg_thrust * dt
-        
-        return total_impulse
+        return float(_trapezoid(thrusts[:n], times[:n]))
     
+    @_memoize
     def _calculate_thrust_coefficient(self, simulation_data: Dict) -> float:
-        thrusts = simulation_data.get('thrust', [])
-        if not thrusts:
+        thrusts = self._get_arrays(simulation_data)['thrust']
+        if not thrusts.size:
             return 0.0
         
-        return np.mean(thrusts) / max(thrusts) if max(thrusts) > 0 else 0.0
+        max_thrust = thrusts.max()
+        return float(thrusts.mean() / max_thrust) if max_thrust > 0 else 0.0
+    
+    def _compute_aero_arrays(self, simulation_data: Dict) -> Dict[str, np.ndarray]:
+        # Every aero/thermal metric needs the same density sweep, so do it once per dataset
+        if self._aero_cache is not None and self._aero_cache[0] is simulation_data:
+            return self._aero_cache[1]
+        
+        arrays = self._get_arrays(simulation_data)
+        n = min(arrays['velocity'].size, arrays['altitude'].size)
+        v = arrays['velocity'][:n]
+        h = arrays['altitude'][:n]
+        drag = arrays['drag'][:n]
+        
+        density, q, reynolds, heat_flux, cd = _aero_kernel(v, h, drag)
+        
+        # Heat flux and drag coefficient are only defined while moving
+        moving = v > 0
+        arrays = {
+            'density': density,
+            'q': q,
+            'reynolds': reynolds,
+            'heat_flux': heat_flux[moving],
+            'cd': cd[moving[:drag.size]]
+        }
+        self._aero_cache = (simulation_data, arrays)
+        return arrays
     
+    @_memoize
     def _calculate_max_cd(self, simulation_data: Dict) -> float:
-        drags = simulation_data.get('drag', [])
-        velocities = simulation_data.get('velocity', [])
-        altitudes = simulation_data.get('altitude', [])
+        arrays = self._get_arrays(simulation_data)
         
-        if not drags or not velocities or not altitudes:
+        if not arrays['drag'].size or not arrays['velocity'].size or not arrays['altitude'].size:
             return 0.0
         
-        max_cd = 0
-        for drag, v, h in zip(drags, velocities, altitudes):
-            if v > 0:
-                density = 1.225 * np.exp(-h / 8500)
-                cd = drag / (0.5 * density * v**2 * 1.0)  # Assuming reference area of 1.0
-                max_cd = max(max_cd, cd)
-        
-        return max_cd
+        cd = self._compute_aero_arrays(simulation_data)['cd']
+        return float(max(cd.max(), 0.0)) if cd.size else 0.0
     
+    @_memoize
     def _calculate_reynolds_range(self, simulation_data: Dict) -> float:
-        velocities = simulation_data.get('velocity', [])
-        altitudes = simulation_data.get('altitude', [])
+        arrays = self._get_arrays(simulation_data)
+        velocities = arrays['velocity']
+        altitudes = arrays['altitude']
         
-        if not velocities or not altitudes:
+        if not velocities.size or not altitudes.size:
             return 0.0
         
-        reynolds_values = []
-        for v, h in zip(velocities, altitudes):
-            density = 1.225 * np.exp(-h / 8500)
-            viscosity = 1.8e-5 * (288.15 / (288.15 - 0.0065 * h))**0.5
-            reynolds = density * v * 1.0 / viscosity
-            reynolds_values.append(reynolds)
-        
-        return max(reynolds_values) - min(reynolds_values) if reynolds_values else 0.0
+        reynolds = self._compute_aero_arrays(simulation_data)['reynolds']
+        # The viscosity model has no real value above ~44 km; leave those samples out
+        reynolds = reynolds[~np.isnan(reynolds)]
+        return float(reynolds.max() - reynolds.min()) if reynolds.size else 0.0
     
+    @_memoize
     def _calculate_max_heat_flux(self, simulation_data: Dict) -> float:
-        velocities = simulation_data.get('velocity', [])
-        altitudes = simulation_data.get('altitude', [])
+        arrays = self._get_arrays(simulation_data)
+        velocities = arrays['velocity']
+        altitudes = arrays['altitude']
         
-        if not velocities or not altitudes:
+        if not velocities.size or not altitudes.size:
             return 0.0
         
-        max_heat_flux = 0
-        for v, h in zip(velocities, altitudes):
-            if v > 0:
-                density = 1.225 * np.exp(-h / 8500)
-                heat_flux = 0.026 * (v**0.8) * (density**0.2) * (v**2) / 2
-                max_heat_flux = max(max_heat_flux, heat_flux)
-        
-        return max_heat_flux
+        heat_flux = self._compute_aero_arrays(simulation_data)['heat_flux']
+        return float(max(heat_flux.max(), 0.0)) if heat_flux.size else 0.0
     
+    @_memoize
     def _calculate_avg_temp_rise(self, simulation_data: Dict) -> float:
-        velocities = simulation_data.get('velocity', [])
-        altitudes = simulation_data.get('altitude', [])
+        arrays = self._get_arrays(simulation_data)
+        velocities = arrays['velocity']
+        altitudes = arrays['altitude']
         
-        if not velocities or not altitudes:
+        if not velocities.size or not altitudes.size:
             return 0.0
         
-        temp_rises = []
-        for v, h in zip(velocities, altitudes):
-            if v > 0:
-                density = 1.225 * np.exp(-h / 8500)
-                heat_flux = 0.026 * (v**0.8) * (density**0.2) * (v**2) / 2
-                temp_rise = heat_flux * 0.01 / (237 * 2700 * 900)  # Aluminum properties
-                temp_rises.append(temp_rise)
-        
-        return np.mean(temp_rises) if temp_rises else 0.0
+        heat_flux = self._compute_aero_arrays(simulation_data)['heat_flux']
+        if not heat_flux.size:
+            return 0.0
+        temp_rise = heat_flux * 0.01 / (237 * 2700 * 900)  # Aluminum properties
+        return float(temp_rise.mean())
     
+    @_memoize
     def _calculate_thermal_efficiency(self, simulation_data: Dict) -> float:
         max_heat_flux = self._calculate_max_heat_flux(simulation_data)
-        max_thrust = max(simulation_data.get('thrust', [0]))
+        max_thrust = self._peak(simulation_data, 'thrust')
         
         if max_thrust > 0:
             return max(0, 100 - (max_heat_flux / max_thrust) * 1000)
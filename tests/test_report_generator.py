@@ -0,0 +1,59 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from report_generator import ReportGenerator
+
+
+def grounded_flight(n=50):
+    # A rocket too heavy to lift off: thrust burns but it never moves
+    time = [i * 0.1 for i in range(n)]
+    return {
+        'time': time,
+        'altitude': [0.0] * n,
+        'velocity': [0.0] * n,
+        'thrust': [1000.0] * n,
+        'isp_values': [250.0] * n,
+        'fuel_remaining': [max(800.0 - 25.0 * t, 0.0) for t in time],
+        'drag': [0.0] * n,
+        'final_time': time[-1],
+        'delta_v': 0.0,
+        'intmass': 10000,
+        'propmass': 800,
+    }
+
+
+CONFIG = {'fuel_type': 'RP1', 'cocp': 7e6, 'ct': 3500, 'altitude': 0, 'intmass': 10000,
+          'propmass': 800, 'mfr': 250, 'dt': 0.1, 'reference_area': 1.0}
+
+
+class ReportGeneratorTest(unittest.TestCase):
+
+    def test_zero_velocity_report(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            # Chart images are written into the working directory
+            os.chdir(tmp)
+            try:
+                path = os.path.join(tmp, 'report.pdf')
+                self.assertEqual(ReportGenerator().generate_simulation_report(grounded_flight(), CONFIG, path), path)
+                self.assertGreater(os.path.getsize(path), 0)
+            finally:
+                os.chdir(cwd)
+
+    def test_zero_velocity_drag_coefficient(self):
+        generator = ReportGenerator()
+        data = grounded_flight()
+        elements = generator._create_technical_details(data, generator._precompute_metrics(data))
+        text = ' '.join(getattr(e, 'text', '') for e in elements)
+        self.assertIn('Average drag coefficient: 0.000', text)
+
+
+if __name__ == '__main__':
+    unittest.main()